@@ -7,6 +7,7 @@
 该模块创建并启动应用程序的主窗口。
 """
 
+import logging
 import sys
 from PyQt5.QtWidgets import QApplication
 from src.app.ui.main_window import MainWindow
@@ -14,6 +15,9 @@ from src.app.ui.main_window import MainWindow
 
 def main():
     """应用程序主函数。"""
+    # 默认只输出警告及以上级别的日志，调试信息不会在界面线程上格式化和输出
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
+
     # 创建应用程序实例
     app = QApplication(sys.argv)
     
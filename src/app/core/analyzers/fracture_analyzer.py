@@ -3,6 +3,8 @@
 该模块实现了BaseAnalyzer接口，专门用于识别和分析图像中的裂缝。
 """
 
+import logging
+
 import cv2
 import numpy as np
 from typing import Dict, Any, List, Tuple
@@ -12,6 +14,8 @@ from src.app.core import image_operations as ops
 from src.app.utils.constants import ResultKeys, StageKeys
 from src.app.core.unit_converter import UnitConverter
 
+logger = logging.getLogger(__name__)
+
 class FractureAnalyzer(BaseAnalyzer):
     """
     裂缝分析器，负责执行所有与裂缝相关的计算和处理。
@@ -29,16 +33,16 @@ class FractureAnalyzer(BaseAnalyzer):
 
     def run_analysis(self, image: np.ndarray, params: Dict[str, Any], dpi: float = 0.0) -> Dict[str, Any]:
         """执行裂缝分析的完整流程。"""
-        print("[DEBUG FractureAnalyzer] --- run_analysis START ---")
+        logger.debug("--- run_analysis START ---")
         
         # 1. 预处理
         gray = ops.convert_to_grayscale(image)
         blurred = ops.apply_gaussian_blur(gray)
-        print("[DEBUG FractureAnalyzer] Grayscale conversion and blurring complete.")
+        logger.debug("Grayscale conversion and blurring complete.")
 
         # 2. 阈值分割
         binary = self._apply_threshold(blurred, params.get('threshold', {}))
-        print("[DEBUG FractureAnalyzer] Thresholding complete.")
+        logger.debug("Thresholding complete.")
         
         # 3. 形态学处理 (参数适配)
         opening_params, closing_params = self._prepare_morph_params(params.get('morphology', {}))
@@ -47,18 +51,18 @@ class FractureAnalyzer(BaseAnalyzer):
             opening_params=opening_params,
             closing_params=closing_params
         )
-        print("[DEBUG FractureAnalyzer] Morphological processing complete.")
+        logger.debug("Morphological processing complete.")
         
         # 4. 裂缝分析与过滤
         fractures = self._analyze_and_filter_fractures(
             binary_processed,
             params.get('filtering', {})
         )
-        print(f"[DEBUG FractureAnalyzer] Contour analysis complete. Found {len(fractures)} fractures.")
+        logger.debug("Contour analysis complete. Found %d fractures.", len(fractures))
 
         # 5. 合并裂缝
         merged_fractures = self._merge_fractures(fractures, params.get('merging', {}), dpi)
-        print(f"[DEBUG FractureAnalyzer] Merging complete. Resulted in {len(merged_fractures)} fractures.")
+        logger.debug("Merging complete. Resulted in %d fractures.", len(merged_fractures))
         
         # 6. 结果可视化
         visualization = self._draw_analysis_results(image.copy(), merged_fractures)
@@ -75,8 +79,9 @@ class FractureAnalyzer(BaseAnalyzer):
                 StageKeys.MORPH.value: binary_processed,
             }
         }
-        print("[DEBUG FractureAnalyzer] --- run_analysis END ---")
-        print(f"[DEBUG FractureAnalyzer] Returning result with keys: {final_result.keys()}")
+        logger.debug("--- run_analysis END ---")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Returning result with keys: %s", list(final_result))
         return final_result
 
     def run_staged_analysis(self, image: np.ndarray, params: Dict[str, Any], stage_key: str) -> Dict[str, Any]:
@@ -168,7 +173,7 @@ class FractureAnalyzer(BaseAnalyzer):
             return ops.apply_sauvola_threshold(image, window_size, k, r)
             
         # 如果方法未知或未提供，则返回原始图像以避免崩溃
-        print(f"警告: 未知的阈值方法 '{method}' 或参数不足。")
+        logger.warning("未知的阈值方法 '%s' 或参数不足。", method)
         return image
 
     def _analyze_and_filter_fractures(self, binary_image: np.ndarray, params: dict) -> List[Dict]:
@@ -217,7 +222,7 @@ class FractureAnalyzer(BaseAnalyzer):
         
         # 将合并距离从毫米转换为像素 (静态调用)
         if dpi <= 0: # 如果没有有效的DPI，则不进行合并
-            print("[WARNING FractureAnalyzer] No valid DPI found, skipping merge.")
+            logger.warning("No valid DPI found, skipping merge.")
             return fractures
         merge_dist_pixels = UnitConverter.mm_to_pixels(merge_dist_mm, dpi)
 
@@ -282,13 +287,13 @@ class FractureAnalyzer(BaseAnalyzer):
 
     def _draw_analysis_results(self, original_image: np.ndarray, fractures: List[Dict]) -> np.ndarray:
         """将分析结果绘制在原始图像上。"""
-        print("[DEBUG Analyzer] Drawing analysis results...")
+        logger.debug("Drawing analysis results...")
         if not fractures:
-            print("[DEBUG Analyzer] No fractures to draw.")
+            logger.debug("No fractures to draw.")
             return original_image
             
         result_image = original_image.copy()
-        print(f"[DEBUG Analyzer] Drawing {len(fractures)} contours with BGR color: (0, 0, 255)")
+        logger.debug("Drawing %d contours with BGR color: (0, 0, 255)", len(fractures))
         for fracture in fractures:
             cv2.drawContours(result_image, [fracture['contour']], -1, (0, 0, 255), 2)
         return result_image
@@ -306,7 +311,10 @@ class FractureAnalyzer(BaseAnalyzer):
             'details': fractures
         }
 
-        print(f"[DEBUG FractureAnalyzer] 生成的测量数据: {measurements}")
+        # 测量数据包含全部轮廓，只在调试级别启用时才格式化
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("生成的测量数据: count=%d, total_area_pixels=%s, total_length_pixels=%s",
+                         count, total_area, total_length)
         return measurements 
 
     def is_result_empty(self, results: Dict[str, Any]) -> bool:
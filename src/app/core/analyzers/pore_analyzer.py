@@ -4,6 +4,8 @@
 它使用分水岭算法来分割粘连的孔洞。
 """
 
+import logging
+
 import cv2
 import numpy as np
 from typing import Dict, Any, List, Tuple
@@ -15,6 +17,8 @@ from .. import image_operations as ops
 from ...utils.constants import ResultKeys, StageKeys
 from ..unit_converter import UnitConverter
 
+logger = logging.getLogger(__name__)
+
 class PoreAnalyzer(BaseAnalyzer):
     """
     孔洞分析器，使用分水岭算法处理孔洞粘连问题。
@@ -32,7 +36,7 @@ class PoreAnalyzer(BaseAnalyzer):
 
     def run_analysis(self, image: np.ndarray, params: Dict[str, Any], dpi: float = 0.0) -> Dict[str, Any]:
         """执行孔洞分析的完整流程。"""
-        print("[DEBUG PoreAnalyzer] --- run_analysis START ---")
+        logger.debug("--- run_analysis START ---")
         # 1. 预处理
         gray = ops.convert_to_grayscale(image)
         blurred = ops.apply_gaussian_blur(gray, kernel_size=(7, 7))
@@ -65,8 +69,10 @@ class PoreAnalyzer(BaseAnalyzer):
                 StageKeys.BINARY.value: thresh,
             }
         }
-        print(f"[DEBUG PoreAnalyzer] Returning result with keys: {final_result.keys()} and preview keys: {final_result[ResultKeys.PREVIEWS.value].keys()}")
-        print("[DEBUG PoreAnalyzer] --- run_analysis END ---")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Returning result with keys: %s and preview keys: %s",
+                         list(final_result), list(final_result[ResultKeys.PREVIEWS.value]))
+        logger.debug("--- run_analysis END ---")
         return final_result
 
     def run_staged_analysis(self, image: np.ndarray, params: Dict[str, Any], stage_key: str) -> Dict[str, Any]:
@@ -138,7 +144,7 @@ class PoreAnalyzer(BaseAnalyzer):
             return ops.apply_sauvola_threshold(image, window_size, k, r)
             
         # 如果方法未知或未提供，则返回原始图像以避免崩溃
-        print(f"警告: 未知的阈值方法 '{method}' 或参数不足。")
+        logger.warning("未知的阈值方法 '%s' 或参数不足。", method)
         return image
         
     def _prepare_for_watershed(self, thresh: np.ndarray, params: dict) -> Tuple:
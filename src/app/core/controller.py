@@ -6,7 +6,9 @@
 """
 
 import json
-from typing import Dict, Any, List, Optional, Tuple
+import logging
+from contextlib import nullcontext
+from typing import IO, Dict, Any, List, Optional, Tuple, Union
 import copy
 
 import numpy as np
@@ -20,8 +22,16 @@ from .analyzers.fracture_analyzer import FractureAnalyzer
 from .analyzers.pore_analyzer import PoreAnalyzer
 from ..utils.constants import PreviewState, ResultKeys, StageKeys
 
+logger = logging.getLogger(__name__)
+
 class Controller(QObject):
     """应用程序控制器类，协调UI和业务逻辑。"""
+
+    # 以像素为单位的阈值窗口参数，降采样预览时需按比例缩小
+    _PIXEL_WINDOW_KEYS = (
+        'block_size', 'adaptive_block_size',
+        'window_size', 'niblack_window_size', 'sauvola_window_size',
+    )
     
     # 信号
     analysis_complete = pyqtSignal(dict)
@@ -54,7 +64,7 @@ class Controller(QObject):
             # 假设 config 目录与 run.py 在同一级
             with open('config/default_params.json', 'r', encoding='utf-8') as f:
                 self.default_params = json.load(f)
-            print("成功加载所有默认参数。")
+            logger.info("成功加载所有默认参数。")
         except (FileNotFoundError, json.JSONDecodeError) as e:
             self.error_occurred.emit(f"加载默认参数文件失败: {e}")
             self.default_params = {} # 确保在失败时是个空字典
@@ -86,31 +96,46 @@ class Controller(QObject):
             # 深拷贝以确保每个分析实例有独立的参数副本
             self.analysis_params = copy.deepcopy(default_params)
             self.parameters_updated.emit(self.analysis_params)
-            print(f"激活分析器: {self.active_analyzer.get_name()}")
+            logger.info("激活分析器: %s", self.active_analyzer.get_name())
         else:
             self.error_occurred.emit(f"未找到ID为 '{analyzer_id}' 的分析器")
 
     def get_active_analyzer(self) -> Optional[BaseAnalyzer]:
         return self.active_analyzer
 
-    def load_parameters(self, filepath: str):
-        """从文件加载分析参数。"""
+    @staticmethod
+    def _open_params_file(target: Union[str, IO[str]], mode: str):
+        """打开参数文件；若传入的已是文件对象则原样使用且不负责关闭。"""
+        if isinstance(target, str):
+            return open(target, mode, encoding='utf-8')
+        return nullcontext(target)
+
+    def load_parameters(self, filepath: Union[str, IO[str]]):
+        """从文件加载分析参数。
+
+        Args:
+            filepath (Union[str, IO[str]]): 参数文件路径，或可读的文本文件对象。
+        """
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
+            with self._open_params_file(filepath, 'r') as f:
                 params = json.load(f)
             # TODO: 未来可以增加版本和分析器类型校验
             self.analysis_params = params
-            print(f"成功从 {filepath} 加载参数。")
+            logger.info("成功从 %s 加载参数。", filepath)
             self.parameters_updated.emit(self.analysis_params)
         except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
             self.error_occurred.emit(f"加载参数文件失败: {e}")
 
-    def save_parameters(self, filepath: str):
-        """将当前分析参数保存到文件。"""
+    def save_parameters(self, filepath: Union[str, IO[str]]):
+        """将当前分析参数保存到文件。
+
+        Args:
+            filepath (Union[str, IO[str]]): 参数文件路径，或可写的文本文件对象。
+        """
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
+            with self._open_params_file(filepath, 'w') as f:
                 json.dump(self.analysis_params, f, ensure_ascii=False, indent=4)
-            print(f"参数成功保存至 {filepath}。")
+            logger.info("参数成功保存至 %s。", filepath)
         except IOError as e:
             self.error_occurred.emit(f"保存参数文件失败: {e}")
             
@@ -124,9 +149,31 @@ class Controller(QObject):
         
         self.parameters_updated.emit(self.analysis_params)
 
-    def request_realtime_preview(self, stage_key: Optional[str] = None):
-        """响应UI的请求，执行一次预览。"""
-        self.run_preview(stage_key=stage_key)
+    def request_realtime_preview(self, stage_key: Optional[str] = None, scale: float = 1.0):
+        """响应UI的请求，执行一次预览。
+
+        Args:
+            stage_key (Optional[str]): 预览的阶段键，为空时运行完整分析。
+            scale (float): 本次分阶段预览的图像缩放比例，取值范围 (0, 1]。
+                参数对话框在拖动滑块期间传入小于1的值以加快中间帧的计算。
+        """
+        self.run_preview(stage_key=stage_key, scale=scale)
+
+    @classmethod
+    def _scale_pixel_windows(cls, params: Dict[str, Any], scale: float) -> Dict[str, Any]:
+        """返回阈值窗口参数按比例缩小后的参数副本，使降采样预览覆盖相同的图像区域。
+
+        缩放后的窗口大小保持为不小于3的奇数；原参数字典不会被修改。
+        """
+        thresh = params.get('threshold')
+        if not isinstance(thresh, dict):
+            return params
+        scaled = dict(thresh)
+        for key in cls._PIXEL_WINDOW_KEYS:
+            value = scaled.get(key)
+            if isinstance(value, int) and not isinstance(value, bool):
+                scaled[key] = max(3, int(round(value * scale)) | 1)
+        return {**params, 'threshold': scaled}
 
     def load_image_from_file(self, file_path: str):
         """从文件加载图像。"""
@@ -150,8 +197,14 @@ class Controller(QObject):
     
 
 
-    def run_preview(self, stage_key: Optional[str] = None):
-        """使用当前激活的分析器运行一次预览并更新UI。"""
+    def run_preview(self, stage_key: Optional[str] = None, scale: float = 1.0):
+        """使用当前激活的分析器运行一次预览并更新UI。
+
+        Args:
+            stage_key (Optional[str]): 预览的阶段键，为空时运行完整分析。
+            scale (float): 分阶段预览的图像缩放比例，只作用于本次预览；
+                完整分析始终使用原始分辨率。
+        """
         if self.current_image is None or self.active_analyzer is None:
             return
 
@@ -161,11 +214,17 @@ class Controller(QObject):
             dpi = self.current_dpi[0] if self.current_dpi and self.current_dpi[0] else 0.0
 
             if stage_key:
-                print(f"[DEBUG Controller] Running STAGED analysis for stage: {stage_key}")
-                results = self.active_analyzer.run_staged_analysis(self.current_image, self.analysis_params, stage_key)
+                scale = min(max(scale, 0.1), 1.0)
+                logger.debug("Running STAGED analysis for stage: %s (scale=%s)", stage_key, scale)
+                image = self.current_image
+                params = self.analysis_params
+                if scale < 1.0:
+                    image = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+                    params = self._scale_pixel_windows(params, scale)
+                results = self.active_analyzer.run_staged_analysis(image, params, stage_key)
                 is_empty = not results.get(ResultKeys.PREVIEWS.value)
             else:
-                print("[DEBUG Controller] Running FULL analysis for preview.")
+                logger.debug("Running FULL analysis for preview.")
                 results = self.active_analyzer.run_analysis(self.current_image, self.analysis_params, dpi)
                 is_empty = self.active_analyzer.is_result_empty(results)
 
@@ -188,11 +247,11 @@ class Controller(QObject):
                 'payload': f"分析时发生错误: {e}"
             }
             self.preview_state_changed.emit(state_to_emit)
-            print(f"预览更新失败: {e}")
+            logger.error("预览更新失败: %s", e)
 
     def run_full_analysis(self):
         """执行一次完整的分析并发出最终结果。"""
-        print("DEBUG: Controller.run_full_analysis() triggered.")
+        logger.debug("Controller.run_full_analysis() triggered.")
         if self.current_image is None or self.active_analyzer is None:
             self.error_occurred.emit("请先加载一张图像再开始分析。")
             return
@@ -224,10 +283,10 @@ class Controller(QObject):
 
           
             self.analysis_complete.emit(final_results)
-            print("分析完成。")
+            logger.info("分析完成。")
         except Exception as e:
             self.error_occurred.emit(f"分析失败: {e}")
-            print(f"分析失败: {e}")
+            logger.error("分析失败: %s", e)
 
     def get_current_image(self):
         return self.current_image
@@ -4,11 +4,15 @@
 这些函数封装了OpenCV、scikit-image等库的基础操作。
 """
 
+import logging
+
 import cv2
 import numpy as np
 from typing import Tuple, Dict, Any, List
 from skimage.filters import threshold_niblack, threshold_sauvola
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_GAUSSIAN_KERNEL = (5, 5)
 
 def convert_to_grayscale(image: np.ndarray) -> np.ndarray:
@@ -47,7 +51,7 @@ def apply_niblack_threshold(image: np.ndarray, window_size: int = 25, k: float =
 
 def apply_sauvola_threshold(image: np.ndarray, window_size: int = 25, k: float = 0.2, r: float = 128) -> np.ndarray:
     """应用Sauvola阈值分割。"""
-    print(f"[DEBUG image_ops] apply_sauvola_threshold called with: window_size={window_size}, k={k}, r={r}")
+    logger.debug("apply_sauvola_threshold called with: window_size=%s, k=%s, r=%s", window_size, k, r)
     if window_size % 2 == 0:
         window_size += 1
     thresh_val = threshold_sauvola(image, window_size=window_size, k=k, r=r)
@@ -78,9 +82,8 @@ def apply_morphological_postprocessing(
     closing_params: Dict[str, Any] = None
 ) -> np.ndarray:
     """对二值图像应用形态学后处理（开运算和闭运算）。"""
-    print(f"[DEBUG image_ops] apply_morphological_postprocessing called with:")
-    print(f"  - opening_params: {opening_params}")
-    print(f"  - closing_params: {closing_params}")
+    logger.debug("apply_morphological_postprocessing called with: opening_params=%s, closing_params=%s",
+                 opening_params, closing_params)
     processed_image = binary_image.copy()
 
     if opening_params and opening_params.get('enabled', False):
@@ -1,7 +1,5 @@
 """UI层模块的初始化文件。"""
 
-print("DEBUG: Initializing src.app.ui package")
-
 # 导入所有UI组件，方便从app.ui直接访问
 from .control_panel import ControlPanel
 from .main_window import MainWindow
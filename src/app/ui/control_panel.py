@@ -4,6 +4,7 @@
 开始分析和调整处理参数。遵循 Google 风格的 Docstrings 和类型提示。
 """
 
+import logging
 from typing import Optional, List, Tuple
 
 from PyQt5.QtCore import pyqtSignal, Qt
@@ -24,6 +25,8 @@ from ..core.controller import Controller
 from .parameter_panels.fracture_params_panel import FractureParamsPanel
 from .parameter_panels.pore_params_panel import PoreParamsPanel
 
+logger = logging.getLogger(__name__)
+
 
 class ControlPanel(QWidget):
     """控制面板类，提供用户交互控制界面。
@@ -40,16 +43,19 @@ class ControlPanel(QWidget):
     export_parameters_requested = pyqtSignal()
     analyzer_changed = pyqtSignal(str)
 
+    # 分析器ID到其UI面板类的映射；测试可通过 patch.dict 替换为轻量的面板
+    PANEL_CLASSES = {
+        'fracture': FractureParamsPanel,
+        'pore_watershed': PoreParamsPanel
+    }
+
     def __init__(self, controller: Controller, parent: Optional[QWidget] = None) -> None:
         """初始化控制面板。"""
         super().__init__(parent)
         self.controller = controller
         
         # 分析器ID到其UI面板类的映射
-        self.analyzer_panel_map = {
-            'fracture': FractureParamsPanel,
-            'pore_watershed': PoreParamsPanel
-        }
+        self.analyzer_panel_map = dict(self.PANEL_CLASSES)
 
         self._init_ui()
         self._connect_signals()
@@ -116,7 +122,7 @@ class ControlPanel(QWidget):
         """从控制器获取并填充分析器选择器。"""
         # 主动从控制器拉取分析器列表
         analyzers = self.controller.get_registered_analyzers()
-        print(f"[DEBUG ControlPanel] 从控制器获取分析器列表: {analyzers}")
+        logger.debug("从控制器获取分析器列表: %s", analyzers)
 
         # 断开信号，以防在填充时意外触发
         self.mode_selector_combo.currentIndexChanged.disconnect(self._on_mode_changed)
@@ -158,6 +164,7 @@ class ControlPanel(QWidget):
             
             # 4. 执行关键连接：
             #   - 将面板的信号连接到控制器的槽 (UI -> Controller)
+            #     realtime_preview_requested 携带 (阶段键, 缩放比例)，与 request_realtime_preview 的参数一一对应
             panel_instance.parameter_changed.connect(self.controller.update_parameter)
             panel_instance.realtime_preview_requested.connect(self.controller.request_realtime_preview)
             #   - 将控制器的信号连接到面板的槽 (Controller -> UI)
@@ -167,10 +174,10 @@ class ControlPanel(QWidget):
             # 5. 将新面板添加到堆叠窗口并显示
             self.params_stack.addWidget(panel_instance)
             self.params_stack.setCurrentWidget(panel_instance)
-            print(f"UI已切换到分析模式: {self.mode_selector_combo.currentText()}")
+            logger.info("UI已切换到分析模式: %s", self.mode_selector_combo.currentText())
             self.analyzer_changed.emit(analyzer_id)
         else:
-            print(f"警告: 未找到分析器ID '{analyzer_id}' 对应的参数面板类。")
+            logger.warning("未找到分析器ID '%s' 对应的参数面板类。", analyzer_id)
         
     def _on_load_image_clicked(self) -> None:
         """打开文件对话框让用户选择图像，并发射信号。"""
@@ -0,0 +1,90 @@
+"""参数设置对话框基类。
+
+该模块定义了各参数设置对话框共用的基类，负责合并参数变更后统一发出、
+缓存各参数组的实时预览提示，以及回填控件时跳过未变化的值。
+"""
+
+import logging
+from typing import Any, Dict, Iterable, Optional
+
+from PyQt5.QtCore import pyqtSignal as Signal, QTimer
+from PyQt5.QtWidgets import QDialog, QWidget
+
+from ...core.controller import Controller
+
+logger = logging.getLogger(__name__)
+
+
+class BaseParameterDialog(QDialog):
+    """
+    所有参数设置对话框的基类。
+
+    该类提供了：
+    - 公共的 `parameter_changed` 信号。
+    - `_queue_parameter`: 同一轮事件循环内的参数变更只记录最新值，
+      回到事件循环后由 `_flush_pending` 统一发出。需要自行调度提交时机的
+      子类可以直接写入 `_pending` 并调用 `_flush_pending`。
+    - `_on_pending_flushed`: 提交后的钩子，子类在其中按需请求实时预览。
+    - `_wants_realtime_preview`: 按参数组的 `ui_hints.realtime` 判断是否需要预览。
+    - `_set_if_changed`: 回填控件时仅在值不同时调用 setValue。
+    """
+
+    parameter_changed = Signal(str, object)
+
+    def __init__(self, controller: Controller, parent: Optional[QWidget] = None):
+        """初始化对话框。
+
+        Args:
+            controller (Controller): 应用程序控制器实例。
+            parent (Optional[QWidget]): 父窗口对象。
+        """
+        super().__init__(parent)
+        self.controller = controller
+        # 待提交参数的最新值
+        self._pending: Dict[str, Any] = {}
+        # 各参数组的 ui_hints.realtime 缓存，在 update_controls 应用新配置时刷新
+        self._realtime_hints: Dict[str, bool] = {}
+
+    def _queue_parameter(self, param_path: str, value: Any):
+        """记录参数的最新值，并在本轮事件循环结束后统一提交。"""
+        if not self._pending:
+            QTimer.singleShot(0, self._flush_pending)
+        self._pending[param_path] = value
+
+    def _flush_pending(self):
+        """发出所有待提交参数的最新值，然后调用 `_on_pending_flushed`。"""
+        pending, self._pending = self._pending, {}
+        if not pending: return
+
+        for param_path, value in pending.items():
+            logger.debug("Parameter changed: %s = %s", param_path, value)
+            self.parameter_changed.emit(param_path, value)
+        self._on_pending_flushed(pending)
+
+    def _on_pending_flushed(self, pending: Dict[str, Any]):
+        """参数提交后的钩子，默认不做任何事。
+
+        Args:
+            pending (Dict[str, Any]): 刚刚发出的参数路径及其值。
+        """
+
+    def _wants_realtime_preview(self, param_paths: Iterable[str]) -> bool:
+        """判断给定参数所属的参数组中是否有需要实时预览的。"""
+        if not self._realtime_hints:
+            self._cache_realtime_hints(self.controller.get_current_parameters())
+        param_groups = {param_path.partition('.')[0] for param_path in param_paths} # e.g., 'threshold'
+        return any(self._realtime_hints.get(group, False) for group in param_groups)
+
+    def _cache_realtime_hints(self, params: dict):
+        """从参数字典中提取各参数组的实时预览提示。"""
+        self._realtime_hints = {
+            group: bool(group_params.get('ui_hints', {}).get('realtime', False))
+            for group, group_params in params.items()
+            if isinstance(group_params, dict)
+        }
+
+    @staticmethod
+    def _set_if_changed(widget: QWidget, value: Any):
+        """仅在值不同时调用 setValue，避免无意义的内部更新和重绘。"""
+        if widget.value() != value:
+            widget.setValue(value)
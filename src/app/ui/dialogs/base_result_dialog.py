@@ -4,7 +4,7 @@
 它内置了状态管理（加载、就绪、空）和通用预览标签页的创建逻辑。
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from PyQt5.QtWidgets import (
     QDialog,
@@ -15,7 +15,7 @@ from PyQt5.QtWidgets import (
     QLabel,
     QApplication
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QPixmap, QImage
 import numpy as np
 import cv2
@@ -37,6 +37,15 @@ class BaseResultDialog(QDialog):
         super().__init__(parent)
         self.controller = controller
         self.tabs: Dict[str, QLabel] = {} # 用于存储对标签页图像控件的引用
+        # 跨次更新复用的BGR->RGB转换缓冲区
+        self._rgb_buffer: Optional[np.ndarray] = None
+        # 实时预览连续到达时使用快速缩放，空闲后再以平滑缩放重绘最后一帧
+        self._rapid_mode = False
+        self._source_pixmaps: Dict[QLabel, QPixmap] = {}
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(150)
+        self._idle_timer.timeout.connect(lambda: self.set_rapid(False))
 
         self._init_ui()
         self._create_common_preview_tabs()
@@ -74,12 +83,17 @@ class BaseResultDialog(QDialog):
             self.status_label.setText(str(payload))
             self.stacked_widget.setCurrentWidget(self.status_label)
         elif state == PreviewState.READY:
+            # 如果载荷不包含最终可视化结果，说明是分阶段的实时预览
+            is_staged_preview = ResultKeys.VISUALIZATION.value not in payload
+            if is_staged_preview:
+                self.set_rapid(True)
+                self._idle_timer.start()
+
             self.stacked_widget.setCurrentWidget(self.tab_widget)
             self._update_all_tabs(payload)
 
-            # 如果载荷不包含最终可视化结果，说明是分阶段预览，
-            # 强制将当前标签页设置为最后一个预览页。
-            if ResultKeys.VISUALIZATION.value not in payload:
+            # 分阶段预览时，强制将当前标签页设置为最后一个预览页。
+            if is_staged_preview:
                 # 假设'形态学处理'是最后一个通用预览标签
                 morph_tab_index = -1
                 for i in range(self.tab_widget.count()):
@@ -91,6 +105,24 @@ class BaseResultDialog(QDialog):
 
         QApplication.restoreOverrideCursor()
 
+    def set_rapid(self, rapid: bool):
+        """切换快速缩放模式。
+
+        退出快速模式时，用平滑缩放重绘各标签页上最近一次的图像。
+
+        Args:
+            rapid (bool): True 表示中间帧使用 Qt.FastTransformation。
+        """
+        was_rapid, self._rapid_mode = self._rapid_mode, rapid
+        if was_rapid and not rapid:
+            for label, pixmap in self._source_pixmaps.items():
+                self._show_scaled(label, pixmap)
+
+    def _show_scaled(self, label: QLabel, pixmap: QPixmap):
+        """按当前模式选择缩放方式，将图像缩放到标签大小后显示。"""
+        mode = Qt.FastTransformation if self._rapid_mode else Qt.SmoothTransformation
+        label.setPixmap(pixmap.scaled(label.size(), Qt.KeepAspectRatio, mode))
+
     def _create_common_preview_tabs(self):
         """创建所有结果窗口共享的通用预览标签页。"""
         common_tabs_info = {
@@ -118,9 +150,12 @@ class BaseResultDialog(QDialog):
             if key in previews:
                 self._set_image_on_label(image_label, previews[key])
 
-    @staticmethod
-    def _set_image_on_label(label: QLabel, image_data: np.ndarray):
-        """将Numpy数组格式的图像设置到QLabel上。"""
+    def _set_image_on_label(self, label: QLabel, image_data: np.ndarray):
+        """将Numpy数组格式的图像设置到QLabel上。
+
+        彩色图像转换到持久的RGB缓冲区中，仅在图像尺寸变化时重新分配。
+        QPixmap.fromImage 会复制像素数据，因此各标签页可以共用同一缓冲区。
+        """
         if image_data is None: return
         
         height, width = image_data.shape[:2]
@@ -128,13 +163,14 @@ class BaseResultDialog(QDialog):
         if len(image_data.shape) == 2:
             qimg = QImage(image_data.data, width, height, width, QImage.Format_Grayscale8)
         else:
-            rgb_image = cv2.cvtColor(image_data, cv2.COLOR_BGR2RGB)
-            qimg = QImage(rgb_image.data, width, height, 3 * width, QImage.Format_RGB888)
-            
+            if self._rgb_buffer is None or self._rgb_buffer.shape != image_data.shape:
+                self._rgb_buffer = np.empty_like(image_data)
+            cv2.cvtColor(image_data, cv2.COLOR_BGR2RGB, dst=self._rgb_buffer)
+            qimg = QImage(self._rgb_buffer.data, width, height, 3 * width, QImage.Format_RGB888)
+
         pixmap = QPixmap.fromImage(qimg)
-        label.setPixmap(pixmap.scaled(
-            label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
-        ))
+        self._source_pixmaps[label] = pixmap
+        self._show_scaled(label, pixmap)
 
     def _populate_tabs(self):
         """
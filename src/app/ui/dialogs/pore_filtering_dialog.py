@@ -3,27 +3,31 @@
 提供一个独立的窗口，用于调整所有与孔洞过滤相关的参数。
 """
 
-from typing import Optional
+from typing import List, Optional
 
-from PyQt5.QtCore import Qt, pyqtSignal as Signal
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtWidgets import (
-    QDialog, QWidget, QVBoxLayout, QFormLayout, QSlider, QLabel, QDoubleSpinBox
+    QWidget, QVBoxLayout, QFormLayout, QSlider, QLabel, QDoubleSpinBox
 )
 
 from src.app.core.controller import Controller
+from .base_parameter_dialog import BaseParameterDialog
 
-class PoreFilteringSettingsDialog(QDialog):
+class PoreFilteringSettingsDialog(BaseParameterDialog):
     """用于设置孔洞过滤参数的对话框。"""
-    
-    parameter_changed = Signal(str, object)
 
     def __init__(self, controller: Controller, parent: Optional[QWidget] = None):
-        super().__init__(parent)
-        self.controller = controller
+        super().__init__(controller, parent)
         
         self.setWindowTitle("调整孔洞过滤参数")
         self.setMinimumWidth(350)
         
+        # 拖动过程中只记录每个参数的最新值，停顿后再统一发出
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(80)
+        self._debounce_timer.timeout.connect(self._flush_pending)
+
         self._init_ui()
         self._connect_signals()
 
@@ -35,7 +39,8 @@ class PoreFilteringSettingsDialog(QDialog):
         self.solidity_slider = QSlider(Qt.Horizontal, objectName="filtering.min_solidity")
         self.solidity_slider.setRange(0, 100) # Representing 0.0 to 1.0
         self.solidity_label = QLabel()
-        self.solidity_slider.valueChanged.connect(lambda v: self.solidity_label.setText(f"{v/100:.2f}"))
+        self._solidity_texts = [f"{v/100:.2f}" for v in range(0, 101)]
+        self._bind_label(self.solidity_slider, self.solidity_label, self._solidity_texts)
         layout.addRow("最小坚实度 (Min Solidity):", self.solidity_slider)
         layout.addRow("当前值:", self.solidity_label)
         
@@ -43,17 +48,30 @@ class PoreFilteringSettingsDialog(QDialog):
         self.area_slider = QSlider(Qt.Horizontal, objectName="filtering.min_area_pixels")
         self.area_slider.setRange(0, 500)
         self.area_label = QLabel()
-        self.area_slider.valueChanged.connect(self.area_label.setNum)
+        self._area_texts = [str(v) for v in range(0, 501)]
+        self._bind_label(self.area_slider, self.area_label, self._area_texts)
         layout.addRow("最小面积 (像素):", self.area_slider)
         layout.addRow("当前值:", self.area_label)
 
+    @staticmethod
+    def _bind_label(slider: QSlider, label: QLabel, texts: List[str]):
+        """用预先生成的文本列表显示滑块的当前值，拖动时不再逐次格式化数字。
+
+        Args:
+            slider (QSlider): 数值来源滑块。
+            label (QLabel): 显示当前值的标签。
+            texts (List[str]): 覆盖滑块整个取值范围的显示文本。
+        """
+        offset = slider.minimum()
+        slider.valueChanged.connect(lambda v: label.setText(texts[v - offset]))
+
     def _connect_signals(self):
         """连接信号。"""
-        self.solidity_slider.sliderReleased.connect(self._on_parameter_changed)
-        self.area_slider.sliderReleased.connect(self._on_parameter_changed)
+        self.solidity_slider.valueChanged.connect(self._on_parameter_changed)
+        self.area_slider.valueChanged.connect(self._on_parameter_changed)
 
     def _on_parameter_changed(self):
-        """当参数变化时发射信号。"""
+        """记录参数的最新值，并(重新)启动去抖定时器。"""
         sender = self.sender()
         if not (sender and sender.objectName()): return
 
@@ -64,7 +82,8 @@ class PoreFilteringSettingsDialog(QDialog):
         else:
             value = sender.value()
         
-        self.parameter_changed.emit(param_path, value)
+        self._pending[param_path] = value
+        self._debounce_timer.start()
 
     def update_controls(self, params: dict):
         """用给定的参数更新UI控件。"""
@@ -81,5 +100,5 @@ class PoreFilteringSettingsDialog(QDialog):
         self.area_slider.blockSignals(False)
 
         # Manually update labels
-        self.solidity_label.setText(f"{self.solidity_slider.value()/100:.2f}")
-        self.area_label.setNum(self.area_slider.value()) 
\ No newline at end of file
+        self.solidity_label.setText(self._solidity_texts[self.solidity_slider.value()])
+        self.area_label.setText(self._area_texts[self.area_slider.value()]) 
\ No newline at end of file
@@ -4,11 +4,10 @@
 开运算和背景膨胀等参数的接口。
 """
 
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
-from PyQt5.QtCore import pyqtSignal as Signal, QTimer
+from PyQt5.QtCore import pyqtSignal as Signal, QTimer, QSignalBlocker
 from PyQt5.QtWidgets import (
-    QDialog,
     QWidget,
     QVBoxLayout,
     QFormLayout,
@@ -19,17 +18,17 @@ from PyQt5.QtWidgets import (
 
 from src.app.core.controller import Controller
 from src.app.utils.constants import StageKeys
+from .base_parameter_dialog import BaseParameterDialog
 
 
-class PoreMorphologyDialog(QDialog):
+class PoreMorphologyDialog(BaseParameterDialog):
     """用于设置孔洞分水岭算法形态学参数的对话框。"""
     
-    parameter_changed = Signal(str, object)
-    realtime_preview_requested = Signal(str)
+    # (阶段键, 缩放比例)
+    realtime_preview_requested = Signal(str, float)
 
     def __init__(self, controller: Controller, parent: Optional[QWidget] = None):
-        super().__init__(parent)
-        self.controller = controller
+        super().__init__(controller, parent)
         
         self.setWindowTitle("调整分水岭参数")
         self.setMinimumWidth(300)
@@ -65,6 +64,9 @@ class PoreMorphologyDialog(QDialog):
         
         main_layout.addWidget(group_box)
 
+        # 控件创建完成后只遍历一次对象树
+        self._all_param_widgets: Tuple[QWidget, ...] = tuple(self.findChildren((QSpinBox, QDoubleSpinBox)))
+
     def _init_preview_timer(self):
         """初始化用于延迟实时预览的计时器。"""
         self.preview_timer = QTimer(self)
@@ -73,42 +75,41 @@ class PoreMorphologyDialog(QDialog):
 
     def _connect_signals(self):
         """连接所有参数控件的信号。"""
-        for spinbox in self.findChildren((QSpinBox, QDoubleSpinBox)):
+        for spinbox in self._all_param_widgets:
             spinbox.valueChanged.connect(self._on_parameter_changed)
 
     def _on_parameter_changed(self, value: int):
         """当参数变化时，通知控制器。"""
         sender = self.sender()
         if not (sender and sender.objectName()): return
+        self._queue_parameter(sender.objectName(), value)
 
-        param_path = sender.objectName()
-        self.parameter_changed.emit(param_path, value)
-
-        current_params = self.controller.get_current_parameters()
-        param_group = param_path.split('.')[0] # 'morphology'
-        
-        hints = current_params.get(param_group, {}).get('ui_hints', {})
-        if hints.get('realtime', False):
+    def _on_pending_flushed(self, pending: Dict[str, Any]):
+        """参数提交后，按需启动实时预览计时器。"""
+        if self._wants_realtime_preview(pending):
             self.preview_timer.stop()
             self.preview_timer.start(500)
 
     def _request_morph_preview(self):
         """发射一个请求预览的信号。"""
         # 对于孔洞分析，形态学预览和二值化预览效果相同
-        self.realtime_preview_requested.emit(StageKeys.MORPH.value)
+        self.realtime_preview_requested.emit(StageKeys.MORPH.value, 1.0)
 
     def update_controls(self, params: dict):
         """根据给定的参数字典更新所有UI控件的值。"""
+        self._cache_realtime_hints(params)
         p = params.get('morphology', {})
         if not p: return
 
-        for spinbox in self.findChildren(QSpinBox):
-            spinbox.blockSignals(True)
+        blockers = [QSignalBlocker(spinbox) for spinbox in self._all_param_widgets]
         try:
-            self.opening_ksize_spinbox.setValue(p.get('opening_ksize', 3))
-            self.opening_iter_spinbox.setValue(p.get('opening_iterations', 2))
-            self.sure_bg_ksize_spinbox.setValue(p.get('sure_bg_ksize', 3))
-            self.dist_ratio_spinbox.setValue(p.get('distance_transform_threshold_ratio', 0.6))
+            for spinbox, key, default in (
+                (self.opening_ksize_spinbox, 'opening_ksize', 3),
+                (self.opening_iter_spinbox, 'opening_iterations', 2),
+                (self.sure_bg_ksize_spinbox, 'sure_bg_ksize', 3),
+                (self.dist_ratio_spinbox, 'distance_transform_threshold_ratio', 0.6),
+            ):
+                self._set_if_changed(spinbox, p.get(key, default))
         finally:
-            for spinbox in self.findChildren(QSpinBox):
-                spinbox.blockSignals(False) 
\ No newline at end of file
+            for blocker in blockers:
+                blocker.unblock() 
\ No newline at end of file
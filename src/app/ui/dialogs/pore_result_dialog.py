@@ -1,5 +1,7 @@
 """孔洞分析结果的专属对话框。"""
 
+import logging
+
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QLabel, QWidget
 
@@ -7,6 +9,8 @@ from .base_result_dialog import BaseResultDialog
 from ...core.controller import Controller
 from ...utils.constants import ResultKeys
 
+logger = logging.getLogger(__name__)
+
 
 class PoreResultDialog(BaseResultDialog):
     """
@@ -20,7 +24,7 @@ class PoreResultDialog(BaseResultDialog):
 
     def _populate_tabs(self):
         """创建孔洞分析专用的标签页。"""
-        print(f"[DEBUG {self.__class__.__name__}] _populate_tabs called.")
+        logger.debug("%s._populate_tabs called.", self.__class__.__name__)
         # 1. 创建最终结果标签页
         final_result_label = QLabel()
         final_result_label.setAlignment(Qt.AlignCenter)
@@ -36,6 +40,6 @@ class PoreResultDialog(BaseResultDialog):
 
     def _update_specific_tabs(self, results: dict):
         """更新孔洞分析的专属标签页。"""
-        print(f"[DEBUG {self.__class__.__name__}] _update_specific_tabs called.")
+        logger.debug("%s._update_specific_tabs called.", self.__class__.__name__)
         # 目前没有专属数据标签页需要更新，但保留此方法以备将来扩展
         pass 
\ No newline at end of file
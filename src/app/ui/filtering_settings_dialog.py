@@ -3,11 +3,10 @@
 提供一个独立的窗口，用于调整所有与最终裂缝筛选相关的参数。
 """
 
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
-from PyQt5.QtCore import pyqtSignal as Signal, QTimer
+from PyQt5.QtCore import QSignalBlocker
 from PyQt5.QtWidgets import (
-    QDialog,
     QWidget,
     QVBoxLayout,
     QFormLayout,
@@ -17,11 +16,10 @@ from PyQt5.QtWidgets import (
 )
 
 from src.app.core.controller import Controller
+from .dialogs.base_parameter_dialog import BaseParameterDialog
 
-class FilteringSettingsDialog(QDialog):
+class FilteringSettingsDialog(BaseParameterDialog):
     """用于设置过滤与合并参数的对话框。"""
-    
-    parameter_changed = Signal(str, object)
 
     def __init__(self, controller: Controller, parent: Optional[QWidget] = None):
         """初始化对话框。
@@ -30,8 +28,7 @@ class FilteringSettingsDialog(QDialog):
             controller (Controller): 应用程序控制器实例。
             parent (Optional[QWidget]): 父窗口对象。
         """
-        super().__init__(parent)
-        self.controller = controller
+        super().__init__(controller, parent)
         
         self.setWindowTitle("调整过滤与合并参数")
         self.setMinimumWidth(300)
@@ -72,10 +69,13 @@ class FilteringSettingsDialog(QDialog):
         
         main_layout.addWidget(group_box)
 
+        # 控件创建完成后只遍历一次对象树，之后按名称直接访问
+        self._all_param_widgets: Tuple[QWidget, ...] = tuple(self.findChildren((QDoubleSpinBox, QCheckBox)))
+        self._param_widgets: Dict[str, QWidget] = {w.objectName(): w for w in self._all_param_widgets}
+
     def _connect_signals(self):
         """连接所有参数控件的信号。"""
-        all_widgets = self.findChildren((QDoubleSpinBox, QCheckBox))
-        for widget in all_widgets:
+        for widget in self._all_param_widgets:
             if isinstance(widget, QDoubleSpinBox):
                 widget.valueChanged.connect(self._on_parameter_changed)
             elif isinstance(widget, QCheckBox):
@@ -86,10 +86,8 @@ class FilteringSettingsDialog(QDialog):
         sender = self.sender()
         if not (sender and sender.objectName()): return
 
-        param_path = sender.objectName()
-        
-        if value is not None:
-            self.parameter_changed.emit(param_path, value)
+        if value is None: return
+        self._queue_parameter(sender.objectName(), value)
 
     def update_controls(self, params: dict):
         """根据给定的参数字典更新所有UI控件的值。"""
@@ -97,14 +95,19 @@ class FilteringSettingsDialog(QDialog):
         p_merge = params.get('merging', {})
         if not (p_filter and p_merge): return
 
-        all_widgets = self.findChildren((QDoubleSpinBox, QCheckBox))
-        for widget in all_widgets: widget.blockSignals(True)
-
+        blockers = [QSignalBlocker(widget) for widget in self._all_param_widgets]
         try:
-            self.findChild(QDoubleSpinBox, "filtering.min_length_mm").setValue(p_filter.get('min_length_mm', 5.0))
-            self.findChild(QDoubleSpinBox, "filtering.min_aspect_ratio").setValue(p_filter.get('min_aspect_ratio', 3.0))
-            self.findChild(QCheckBox, "merging.enabled").setChecked(p_merge.get('enabled', False))
-            self.findChild(QDoubleSpinBox, "merging.merge_distance_mm").setValue(p_merge.get('merge_distance_mm', 2.0))
-            self.findChild(QDoubleSpinBox, "merging.max_angle_diff").setValue(p_merge.get('max_angle_diff', 15.0))
+            widgets = self._param_widgets
+            for name, section, key, default in (
+                ("filtering.min_length_mm", p_filter, 'min_length_mm', 5.0),
+                ("filtering.min_aspect_ratio", p_filter, 'min_aspect_ratio', 3.0),
+                ("merging.merge_distance_mm", p_merge, 'merge_distance_mm', 2.0),
+                ("merging.max_angle_diff", p_merge, 'max_angle_diff', 15.0),
+            ):
+                self._set_if_changed(widgets[name], section.get(key, default))
+            enabled = p_merge.get('enabled', False)
+            if widgets["merging.enabled"].isChecked() != enabled:
+                widgets["merging.enabled"].setChecked(enabled)
         finally:
-            for widget in all_widgets: widget.blockSignals(False) 
\ No newline at end of file
+            for blocker in blockers:
+                blocker.unblock() 
\ No newline at end of file
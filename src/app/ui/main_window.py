@@ -4,6 +4,8 @@
 构成了应用程序的完整界面。
 """
 
+import logging
+
 from PyQt5.QtWidgets import (
     QMainWindow, 
     QAction, 
@@ -33,6 +35,8 @@ from .dialogs.pore_result_dialog import PoreResultDialog
 from ..core.controller import Controller
 from ..utils.constants import StageKeys, PreviewState, ResultKeys
 
+logger = logging.getLogger(__name__)
+
 
 class MainWindow(QMainWindow):
     """主窗口类，应用程序的主界面。
@@ -197,7 +201,7 @@ class MainWindow(QMainWindow):
                 # 同时触发结果对话框的创建和显示
                 self._on_analyzer_changed()
 
-            print(f"图像已成功加载: {file_path}")
+            logger.info("图像已成功加载: %s", file_path)
         else:
             # 显示错误消息
             self._on_error_occurred(message)
@@ -286,7 +290,7 @@ class MainWindow(QMainWindow):
     def _on_analyzer_changed(self):
         """处理分析器切换的槽函数。"""
         # 清空旧的预览和结果
-        print("[DEBUG MainWindow] Analyzer changed, clearing old results.")
+        logger.debug("Analyzer changed, clearing old results.")
         self.main_preview_window.clear()
         self.result_panel.clear_results()
         
@@ -297,24 +301,23 @@ class MainWindow(QMainWindow):
 
         # 根据当前分析器创建新的结果对话框
         analyzer_id = self.controller.get_current_analyzer_id()
-        print(f"[DEBUG MainWindow] Current analyzer ID: {analyzer_id}")
+        logger.debug("Current analyzer ID: %s", analyzer_id)
         if analyzer_id in self.result_dialog_classes:
             # 如果已存在一个对话框，先关闭并删除
             if self.current_result_dialog:
-                print("[DEBUG MainWindow] Closing existing result dialog.")
+                logger.debug("Closing existing result dialog.")
                 self.current_result_dialog.close()
                 self.current_result_dialog.deleteLater()
 
             dialog_class = self.result_dialog_classes[analyzer_id]
-            print(f"[DEBUG MainWindow] Creating new result dialog: {dialog_class.__name__}")
+            logger.debug("Creating new result dialog: %s", dialog_class.__name__)
             self.current_result_dialog = dialog_class(self.controller, self)
             self.current_result_dialog.show()
         
     def _on_preview_updated(self, payload: dict):
         """处理实时预览更新的槽函数。"""
-        print(f"[DEBUG MainWindow] Received preview_state_changed signal. Payload state: {payload.get('state')}")
+        logger.debug("Received preview_state_changed signal. Payload state: %s", payload.get('state'))
         if self.current_result_dialog:
-            print("[DEBUG MainWindow] Forwarding payload to current result dialog.")
             self.current_result_dialog.update_content(payload)
         
     def closeEvent(self, event):
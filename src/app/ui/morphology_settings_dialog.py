@@ -3,11 +3,11 @@
 提供一个独立的窗口，用于调整所有与形态学后处理相关的参数。
 """
 
-from typing import Optional
+import logging
+from typing import Any, Dict, Optional, Tuple
 
-from PyQt5.QtCore import pyqtSignal as Signal, QTimer
+from PyQt5.QtCore import pyqtSignal as Signal, QTimer, QSignalBlocker
 from PyQt5.QtWidgets import (
-    QDialog,
     QWidget,
     QVBoxLayout,
     QFormLayout,
@@ -17,13 +17,16 @@ from PyQt5.QtWidgets import (
 
 from src.app.core.controller import Controller
 from src.app.utils.constants import StageKeys
+from .dialogs.base_parameter_dialog import BaseParameterDialog
 
+logger = logging.getLogger(__name__)
 
-class MorphologySettingsDialog(QDialog):
+
+class MorphologySettingsDialog(BaseParameterDialog):
     """用于设置形态学参数的对话框。"""
     
-    parameter_changed = Signal(str, object)
-    realtime_preview_requested = Signal(str)
+    # (阶段键, 缩放比例)
+    realtime_preview_requested = Signal(str, float)
 
     def __init__(self, controller: Controller, parent: Optional[QWidget] = None):
         """初始化对话框。
@@ -32,8 +35,7 @@ class MorphologySettingsDialog(QDialog):
             controller (Controller): 应用程序控制器实例。
             parent (Optional[QWidget]): 父窗口对象。
         """
-        super().__init__(parent)
-        self.controller = controller
+        super().__init__(controller, parent)
         
         self.setWindowTitle("调整形态学参数")
         self.setMinimumWidth(300)
@@ -67,6 +69,10 @@ class MorphologySettingsDialog(QDialog):
         
         main_layout.addWidget(group_box)
 
+        # 控件创建完成后只遍历一次对象树，之后按名称直接访问
+        self._all_param_widgets: Tuple[QSpinBox, ...] = tuple(self.findChildren(QSpinBox))
+        self._param_widgets: Dict[str, QSpinBox] = {w.objectName(): w for w in self._all_param_widgets}
+
     def _init_preview_timer(self):
         """初始化用于延迟实时预览的计时器。"""
         self.preview_timer = QTimer(self)
@@ -75,48 +81,43 @@ class MorphologySettingsDialog(QDialog):
 
     def _connect_signals(self):
         """连接所有参数控件的信号。"""
-        for spinbox in self.findChildren(QSpinBox):
+        for spinbox in self._all_param_widgets:
             spinbox.valueChanged.connect(self._on_parameter_changed)
 
     def _on_parameter_changed(self, value: int):
         """当参数变化时，通知控制器。"""
         sender = self.sender()
         if not (sender and sender.objectName()): return
+        self._queue_parameter(sender.objectName(), value)
 
-        param_path = sender.objectName()
-        print(f"[DEBUG MorphDialog] Parameter changed: {param_path} = {value}")
-        self.parameter_changed.emit(param_path, value)
-
-        # 检查是否需要触发实时预览
-        current_params = self.controller.get_current_parameters()
-        print(f"[DEBUG MorphDialog] All current params from controller: {current_params}")
-        param_group = param_path.split('.')[0] # e.g., 'morphology'
-        
-        hints = current_params.get(param_group, {}).get('ui_hints', {})
-        print(f"[DEBUG MorphDialog] Retrieved hints for group '{param_group}': {hints}")
-        if hints.get('realtime', False):
-            print(f"[DEBUG MorphDialog] Realtime hint is True. Starting preview timer.")
+    def _on_pending_flushed(self, pending: Dict[str, Any]):
+        """参数提交后，按需启动实时预览计时器。"""
+        if self._wants_realtime_preview(pending):
+            logger.debug("Realtime hint is True. Starting preview timer.")
             # 先停止计时器，确保多次快速变更只触发一次预览
             self.preview_timer.stop()
             self.preview_timer.start(500) # 增加到500ms延迟
 
     def _request_morph_preview(self):
         """发射一个请求形态学阶段预览的信号。"""
-        self.realtime_preview_requested.emit(StageKeys.MORPH.value)
+        self.realtime_preview_requested.emit(StageKeys.MORPH.value, 1.0)
 
     def update_controls(self, params: dict):
         """根据给定的参数字典更新所有UI控件的值。"""
+        self._cache_realtime_hints(params)
         p = params.get('morphology', {})
         if not p: return
 
-        for spinbox in self.findChildren(QSpinBox):
-            spinbox.blockSignals(True)
-
+        blockers = [QSignalBlocker(spinbox) for spinbox in self._all_param_widgets]
         try:
-            self.findChild(QSpinBox, "morphology.open_kernel_size").setValue(p.get('open_kernel_size', 3))
-            self.findChild(QSpinBox, "morphology.open_iterations").setValue(p.get('open_iterations', 1))
-            self.findChild(QSpinBox, "morphology.close_kernel_size").setValue(p.get('close_kernel_size', 3))
-            self.findChild(QSpinBox, "morphology.close_iterations").setValue(p.get('close_iterations', 1))
+            widgets = self._param_widgets
+            for name, key, default in (
+                ("morphology.open_kernel_size", 'open_kernel_size', 3),
+                ("morphology.open_iterations", 'open_iterations', 1),
+                ("morphology.close_kernel_size", 'close_kernel_size', 3),
+                ("morphology.close_iterations", 'close_iterations', 1),
+            ):
+                self._set_if_changed(widgets[name], p.get(key, default))
         finally:
-            for spinbox in self.findChildren(QSpinBox):
-                spinbox.blockSignals(False) 
\ No newline at end of file
+            for blocker in blockers:
+                blocker.unblock() 
\ No newline at end of file
@@ -7,13 +7,14 @@ from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QPixmap, QImage
 import numpy as np
-import cv2
 
 
 class MultiStagePreviewWidget(QWidget):
     """一个简单的、用于显示单张图像的预览组件。"""
     def __init__(self, parent=None):
         super().__init__(parent)
+        # QImage 只借用 numpy 缓冲区的指针，需要保持引用以防被回收
+        self._qimage_buffer = None
         self._init_ui()
 
     def _init_ui(self):
@@ -36,12 +37,21 @@ class MultiStagePreviewWidget(QWidget):
             return
             
         height, width = image_data.shape[:2]
-        
-        if len(image_data.shape) == 2:
-            qimg = QImage(image_data.data, width, height, width, QImage.Format_Grayscale8)
+        # 仅在内存不连续时才复制；QImage 借用该缓冲区，需保持引用
+        if image_data.flags['C_CONTIGUOUS']:
+            buf = image_data
+        else:
+            buf = np.ascontiguousarray(image_data)
+        self._qimage_buffer = buf
+
+        if len(buf.shape) == 2:
+            qimg = QImage(buf.data, width, height, width, QImage.Format_Grayscale8)
+        elif hasattr(QImage, 'Format_BGR888'):
+            # Qt 5.14+ 可直接使用OpenCV的BGR内存布局，无需颜色转换
+            qimg = QImage(buf.data, width, height, 3 * width, QImage.Format_BGR888)
         else:
-            rgb_image = cv2.cvtColor(image_data, cv2.COLOR_BGR2RGB)
-            qimg = QImage(rgb_image.data, width, height, 3 * width, QImage.Format_RGB888)
+            # 旧版Qt: 按RGB包装BGR缓冲区，再由Qt交换通道
+            qimg = QImage(buf.data, width, height, 3 * width, QImage.Format_RGB888).rgbSwapped()
             
         pixmap = QPixmap.fromImage(qimg)
         self.image_label.setPixmap(pixmap.scaled(
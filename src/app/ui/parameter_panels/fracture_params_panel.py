@@ -5,31 +5,38 @@
 这些按钮会打开相应的参数设置对话框。
 """
 
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
-from PyQt5.QtCore import pyqtSignal as Signal
+from PyQt5.QtCore import pyqtSignal as Signal, QTimer
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QPushButton, QGroupBox
 
 from ...core.controller import Controller
-from ..threshold_settings_dialog import ThresholdSettingsDialog
-from ..morphology_settings_dialog import MorphologySettingsDialog
-from ..filtering_settings_dialog import FilteringSettingsDialog
+
+# 对话框模块在首次打开时才导入，以缩短应用启动时间
+if TYPE_CHECKING:
+    from ..threshold_settings_dialog import ThresholdSettingsDialog
+    from ..morphology_settings_dialog import MorphologySettingsDialog
+    from ..filtering_settings_dialog import FilteringSettingsDialog
 
 class FractureParamsPanel(QWidget):
     """
     为裂缝分析提供参数调整入口的UI面板。
     """
     parameter_changed = Signal(str, object)
-    realtime_preview_requested = Signal(str)
+    # (阶段键, 缩放比例)
+    realtime_preview_requested = Signal(str, float)
 
     def __init__(self, controller: Controller, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.controller = controller
 
         # 对话框实例
-        self.threshold_dialog: Optional[ThresholdSettingsDialog] = None
-        self.morphology_dialog: Optional[MorphologySettingsDialog] = None
-        self.filtering_dialog: Optional[FilteringSettingsDialog] = None
+        self.threshold_dialog: Optional['ThresholdSettingsDialog'] = None
+        self.morphology_dialog: Optional['MorphologySettingsDialog'] = None
+        self.filtering_dialog: Optional['FilteringSettingsDialog'] = None
+
+        # 合并同一事件循环周期内的多次参数更新，只刷新一次对话框
+        self._pending_params: Optional[dict] = None
 
         self._init_ui()
         self._connect_signals()
@@ -61,6 +68,15 @@ class FractureParamsPanel(QWidget):
         
     def on_parameters_updated(self, params: dict):
         """当控制器中的参数更新时，更新所有已打开的对话框。"""
+        if self._pending_params is None:
+            QTimer.singleShot(0, self._flush_parameters_update)
+        self._pending_params = params
+
+    def _flush_parameters_update(self):
+        """将最近一次收到的参数推送给所有已打开的对话框。"""
+        params, self._pending_params = self._pending_params, None
+        if params is None:
+            return
         if self.threshold_dialog:
             self.threshold_dialog.update_controls(params)
         if self.morphology_dialog:
@@ -71,11 +87,10 @@ class FractureParamsPanel(QWidget):
     def _open_threshold_dialog(self):
         """打开二值化参数设置对话框。"""
         if self.threshold_dialog is None:
+            from ..threshold_settings_dialog import ThresholdSettingsDialog
             self.threshold_dialog = ThresholdSettingsDialog(self.controller, self)
             self.threshold_dialog.parameter_changed.connect(self.parameter_changed)
             self.threshold_dialog.realtime_preview_requested.connect(self.realtime_preview_requested)
-            # 连接控制器信号，以便在参数从外部（如加载文件）更新时，对话框能同步更新
-            self.controller.parameters_updated.connect(self.threshold_dialog.update_controls)
 
         # 每次打开时都确保它显示的是最新的参数
         self.threshold_dialog.update_controls(self.controller.get_current_parameters())
@@ -85,10 +100,10 @@ class FractureParamsPanel(QWidget):
     def _open_morphology_dialog(self):
         """打开形态学参数设置对话框。"""
         if self.morphology_dialog is None:
+            from ..morphology_settings_dialog import MorphologySettingsDialog
             self.morphology_dialog = MorphologySettingsDialog(self.controller, self)
             self.morphology_dialog.parameter_changed.connect(self.parameter_changed)
             self.morphology_dialog.realtime_preview_requested.connect(self.realtime_preview_requested)
-            self.controller.parameters_updated.connect(self.morphology_dialog.update_controls)
 
         self.morphology_dialog.update_controls(self.controller.get_current_parameters())
         self.morphology_dialog.show()
@@ -97,9 +112,9 @@ class FractureParamsPanel(QWidget):
     def _open_filtering_dialog(self):
         """打开过滤与合并参数设置对话框。"""
         if self.filtering_dialog is None:
+            from ..filtering_settings_dialog import FilteringSettingsDialog
             self.filtering_dialog = FilteringSettingsDialog(self.controller, self)
             self.filtering_dialog.parameter_changed.connect(self.parameter_changed)
-            self.controller.parameters_updated.connect(self.filtering_dialog.update_controls)
             
         self.filtering_dialog.update_controls(self.controller.get_current_parameters())
         self.filtering_dialog.show()
@@ -1,30 +1,45 @@
 """孔洞分析模式的参数设置面板。
 """
 
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
-from PyQt5.QtCore import pyqtSignal as Signal
+from PyQt5.QtCore import pyqtSignal as Signal, QTimer
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QPushButton, QGroupBox
 
 from ...core.controller import Controller
-from ..dialogs.pore_filtering_dialog import PoreFilteringSettingsDialog
-from ..dialogs.pore_morphology_dialog import PoreMorphologyDialog
-# We can reuse threshold and morphology dialogs if their logic is generic enough
-from ..threshold_settings_dialog import ThresholdSettingsDialog
+
+# 对话框模块在首次打开时才导入，以缩短应用启动时间
+if TYPE_CHECKING:
+    from ..dialogs.pore_filtering_dialog import PoreFilteringSettingsDialog
+    from ..dialogs.pore_morphology_dialog import PoreMorphologyDialog
+    # We can reuse threshold and morphology dialogs if their logic is generic enough
+    from ..threshold_settings_dialog import ThresholdSettingsDialog
 
 
 class PoreParamsPanel(QWidget):
     """为孔洞分析提供参数调整入口的UI面板。"""
     parameter_changed = Signal(str, object)
-    realtime_preview_requested = Signal(str)
+    # (阶段键, 缩放比例)
+    realtime_preview_requested = Signal(str, float)
 
     def __init__(self, controller: Controller, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.controller = controller
 
-        self.threshold_dialog: Optional[ThresholdSettingsDialog] = None
-        self.morphology_dialog: Optional[PoreMorphologyDialog] = None
-        self.filtering_dialog: Optional[PoreFilteringSettingsDialog] = None
+        self.threshold_dialog: Optional['ThresholdSettingsDialog'] = None
+        self.morphology_dialog: Optional['PoreMorphologyDialog'] = None
+        self.filtering_dialog: Optional['PoreFilteringSettingsDialog'] = None
+
+        # 合并同一事件循环周期内的多次参数更新，只刷新一次对话框
+        self._pending_params: Optional[dict] = None
+
+        # 对话框滑块拖动时的实时预览请求去抖，只转发最后一次
+        self._pending_preview_key: Optional[str] = None
+        self._pending_preview_scale = 1.0
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(80)
+        self._preview_timer.timeout.connect(self._flush_preview)
 
         self._init_ui()
         self._connect_signals()
@@ -56,6 +71,15 @@ class PoreParamsPanel(QWidget):
 
     def on_parameters_updated(self, params: dict):
         """当控制器参数更新时，同步所有对话框。"""
+        if self._pending_params is None:
+            QTimer.singleShot(0, self._flush_parameters_update)
+        self._pending_params = params
+
+    def _flush_parameters_update(self):
+        """将最近一次收到的参数推送给所有已打开的对话框。"""
+        params, self._pending_params = self._pending_params, None
+        if params is None:
+            return
         if self.threshold_dialog:
             self.threshold_dialog.update_controls(params)
         if self.morphology_dialog:
@@ -63,24 +87,39 @@ class PoreParamsPanel(QWidget):
         if self.filtering_dialog:
             self.filtering_dialog.update_controls(params)
 
+    def _queue_preview(self, key: str, scale: float):
+        """记录最近一次预览请求及其缩放比例，并(重新)启动去抖定时器。"""
+        self._pending_preview_key = key
+        self._pending_preview_scale = scale
+        self._preview_timer.start()
+
+    def _flush_preview(self):
+        """定时器到期后发出最后一次预览请求。"""
+        key, self._pending_preview_key = self._pending_preview_key, None
+        if key is not None:
+            self.realtime_preview_requested.emit(key, self._pending_preview_scale)
+
     def _open_threshold_dialog(self):
         if self.threshold_dialog is None:
+            from ..threshold_settings_dialog import ThresholdSettingsDialog
             self.threshold_dialog = ThresholdSettingsDialog(self.controller, self)
             self.threshold_dialog.parameter_changed.connect(self.parameter_changed)
-            self.threshold_dialog.realtime_preview_requested.connect(self.realtime_preview_requested)
+            self.threshold_dialog.realtime_preview_requested.connect(self._queue_preview)
         self.threshold_dialog.update_controls(self.controller.get_current_parameters())
         self.threshold_dialog.show()
 
     def _open_morphology_dialog(self):
         if self.morphology_dialog is None:
+            from ..dialogs.pore_morphology_dialog import PoreMorphologyDialog
             self.morphology_dialog = PoreMorphologyDialog(self.controller, self)
             self.morphology_dialog.parameter_changed.connect(self.parameter_changed)
-            self.morphology_dialog.realtime_preview_requested.connect(self.realtime_preview_requested)
+            self.morphology_dialog.realtime_preview_requested.connect(self._queue_preview)
         self.morphology_dialog.update_controls(self.controller.get_current_parameters())
         self.morphology_dialog.show()
 
     def _open_filtering_dialog(self):
         if self.filtering_dialog is None:
+            from ..dialogs.pore_filtering_dialog import PoreFilteringSettingsDialog
             self.filtering_dialog = PoreFilteringSettingsDialog(self.controller, self)
             self.filtering_dialog.parameter_changed.connect(self.parameter_changed)
         self.filtering_dialog.update_controls(self.controller.get_current_parameters())
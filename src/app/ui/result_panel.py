@@ -3,36 +3,135 @@
 该模块提供了一个包含摘要和详细数据视图的面板，
 并提供了将结果导出为CSV或Word文档的功能。
 """
+import functools
 import io
+import logging
+import types
 from PIL import Image
 
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QTabWidget,
-    QTableWidget, QTableWidgetItem, QHeaderView,
+    QTableView, QHeaderView,
     QPushButton, QHBoxLayout, QFileDialog, QFormLayout
 )
-from PyQt5.QtCore import Qt
-from typing import Dict, Any, Optional
+from PyQt5.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, pyqtSignal
+)
+from typing import Dict, Any, Optional, List, Callable, Tuple
+
+from ..utils.exporter import export_to_csv, export_to_word
+
+logger = logging.getLogger(__name__)
+
+# 程序键名到用户友好标签的只读映射
+KEY_MAP = types.MappingProxyType({
+    'count': '总数量',
+    'total_area_pixels': '总面积 (像素)',
+    'total_area_mm2': '总面积 (mm²)',
+    'total_length_pixels': '总长度 (像素)',
+    'total_length_mm': '总长度 (mm)',
+    'porosity': '孔隙度 (%)',
+    'avg_length_mm': '平均长度 (mm)',
+    'avg_width_mm': '平均宽度 (mm)',
+})
+
+
+# 以"是否为浮点数"作为下标选择格式化函数：False -> str，True -> 保留四位小数
+_CELL_FORMATTERS: Tuple[Callable[[Any], str], Callable[[Any], str]] = (str, "{:.4f}".format)
+
+
+@functools.lru_cache(maxsize=8)
+def _translate_headers(headers: Tuple[str, ...]) -> Tuple[str, ...]:
+    """将一组表头键名翻译为显示标签，结果按表头元组缓存。"""
+    return tuple(KEY_MAP.get(h, h) for h in headers)
+
+
+class DetailsTableModel(QAbstractTableModel):
+    """以详细数据字典列表为数据源的只读表格模型。
+
+    模型直接引用分析结果中的 `details` 列表，不为每个单元格创建对象，
+    视图只会为可见的行调用 `data()`。
+    """
+
+    def __init__(self, parent=None):
+        """初始化模型。
+
+        Args:
+            parent: 父对象。
+        """
+        super().__init__(parent)
+        self._rows: List[Dict[str, Any]] = []
+        self._headers: List[str] = []
+        self._header_labels: Tuple[str, ...] = ()
+
+    def set_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """替换模型的全部数据。
+
+        表头翻译只在这里计算一次。各行同一列的值类型不一定相同
+        （例如缺失值为 None），因此格式化仍在 `data()` 中按值进行。
+        """
+        self.beginResetModel()
+        self._rows = rows or []
+        self._headers = list(self._rows[0].keys()) if self._rows else []
+        self._header_labels = _translate_headers(tuple(self._headers))
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._header_labels[section]
+        return str(section + 1)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        value = self._rows[index.row()].get(self._headers[index.column()])
+        return _CELL_FORMATTERS[isinstance(value, float)](value)
+
+
+class _ExportSignals(QObject):
+    """导出任务的信号载体（QRunnable本身不能定义信号）。"""
+    done = pyqtSignal(object)  # 成功时为None，失败时为异常对象
+
+
+class _ExportWorker(QRunnable):
+    """在线程池中执行一次导出操作的任务。"""
+
+    def __init__(self, export_fn: Callable[[], None]):
+        """初始化任务。
+
+        Args:
+            export_fn: 执行实际导出的无参可调用对象。
+        """
+        super().__init__()
+        self._export_fn = export_fn
+        self.signals = _ExportSignals()
+
+    def run(self):
+        error = None
+        try:
+            self._export_fn()
+        except Exception as e:
+            error = e
+        self.signals.done.emit(error)
 
-from ..utils.exporter import Exporter
 
 class ResultPanel(QWidget):
     """结果面板类，用于显示、管理和导出分析结果。"""
     
-    KEY_MAP = {
-        'count': '总数量',
-        'total_area_pixels': '总面积 (像素)',
-        'total_area_mm2': '总面积 (mm²)',
-        'total_length_pixels': '总长度 (像素)',
-        'total_length_mm': '总长度 (mm)',
-        'porosity': '孔隙度 (%)',
-        'avg_length_mm': '平均长度 (mm)',
-        'avg_width_mm': '平均宽度 (mm)',
-    }
+    KEY_MAP = KEY_MAP
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_results: Dict[str, Any] = {}
+        self._export_worker: Optional[_ExportWorker] = None
         self._init_ui()
         self._connect_signals()
         
@@ -49,9 +148,35 @@ class ResultPanel(QWidget):
         # 标签页
         self.tabs = QTabWidget()
         self.summary_widget = QWidget()
-        self.summary_layout = QFormLayout(self.summary_widget)
+        summary_container_layout = QVBoxLayout(self.summary_widget)
+
+        # 常驻的提示和DPI信息控件，清空结果时只切换可见性，不销毁重建
+        self._placeholder_label = QLabel("请加载图像并开始分析...")
+        self._dpi_widget = QWidget()
+        dpi_layout = QFormLayout(self._dpi_widget)
+        dpi_layout.setContentsMargins(0, 0, 0, 0)
+        self._dpi_value_label = QLabel()
+        dpi_layout.addRow(QLabel("图像DPI:"), self._dpi_value_label)
+        dpi_layout.addRow(QLabel("状态:"), QLabel("请开始分析..."))
+
+        # 动态摘要行放在单独的容器中
+        self._summary_form = QWidget()
+        self.summary_layout = QFormLayout(self._summary_form)
+        self.summary_layout.setContentsMargins(0, 0, 0, 0)
+        # 缓存摘要值标签；键集合不变时只更新文本，不重建控件。
+        # 键顺序为None表示尚未建立任何摘要行。
+        self._summary_labels: Dict[str, QLabel] = {}
+        self._summary_key_order: Optional[List[str]] = None
+
+        summary_container_layout.addWidget(self._placeholder_label)
+        summary_container_layout.addWidget(self._dpi_widget)
+        summary_container_layout.addWidget(self._summary_form)
+        summary_container_layout.addStretch()
         
-        self.details_table = QTableWidget()
+        self.details_model = DetailsTableModel(self)
+        self.details_table = QTableView()
+        self.details_table.setModel(self.details_model)
+        self.details_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
         
         self.tabs.addTab(self.summary_widget, "摘要")
         self.tabs.addTab(self.details_table, "详细数据")
@@ -76,7 +201,8 @@ class ResultPanel(QWidget):
 
     def update_analysis_results(self, results: Dict[str, Any]) -> None:
         """根据新的分析结果更新整个面板。"""
-        print(f"[DEBUG ResultPanel] Received analysis results: {results}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received analysis results with keys: %s", list(results))
         self.current_results = results
         # 直接从顶层 results 字典中获取 'measurements'
         measurements = results.get('measurements', {})
@@ -85,8 +211,8 @@ class ResultPanel(QWidget):
         self._update_summary_tab(measurements)
         self._update_details_tab(details)
         
-        # 仅当结果有效时才启用按钮
-        if measurements:
+        # 仅当结果有效且没有正在进行的导出时才启用按钮
+        if measurements and self._export_worker is None:
             self.export_csv_btn.setEnabled(True)
             self.export_word_btn.setEnabled(True)
         else:
@@ -95,57 +221,48 @@ class ResultPanel(QWidget):
 
     def _update_summary_tab(self, measurements: Dict[str, Any]):
         """动态更新摘要信息。"""
-        # 清空旧布局
+        # 不在摘要中显示详情
+        keys = [key for key in measurements if key != 'details']
+
+        self._placeholder_label.setVisible(False)
+        self._dpi_widget.setVisible(False)
+        self._summary_form.setVisible(True)
+
+        if keys != self._summary_key_order:
+            # 键集合发生变化时才重建布局
+            self._clear_summary()
+            for key in keys:
+                value_label = QLabel()
+                self.summary_layout.addRow(QLabel(f"{self.KEY_MAP.get(key, key)}:"), value_label)
+                self._summary_labels[key] = value_label
+            self._summary_key_order = keys
+
+        for key in keys:
+            value = measurements[key]
+            self._summary_labels[key].setText(_CELL_FORMATTERS[isinstance(value, float)](value))
+
+    def _clear_summary(self):
+        """移除摘要布局中的所有行并清空标签缓存。"""
         while self.summary_layout.count():
             item = self.summary_layout.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
-
-        # 动态添加新行
-        for key, value in measurements.items():
-            if key == 'details': continue # 不在摘要中显示详情
-            
-            label = self.KEY_MAP.get(key, key)
-            
-            if isinstance(value, float):
-                value_str = f"{value:.4f}"
-            else:
-                value_str = str(value)
-                
-            self.summary_layout.addRow(QLabel(f"{label}:"), QLabel(value_str))
+        self._summary_labels = {}
+        self._summary_key_order = None
 
     def _update_details_tab(self, details: list):
         """更新详细数据表格。"""
-        if not details:
-            self.details_table.setRowCount(0)
-            self.details_table.setColumnCount(0)
-            return
-
-        headers = list(details[0].keys())
-        self.details_table.setRowCount(len(details))
-        self.details_table.setColumnCount(len(headers))
-        self.details_table.setHorizontalHeaderLabels([self.KEY_MAP.get(h, h) for h in headers])
-
-        for row, item in enumerate(details):
-            for col, key in enumerate(headers):
-                value = item.get(key)
-                if isinstance(value, float):
-                    value_str = f"{value:.4f}"
-                else:
-                    value_str = str(value)
-                self.details_table.setItem(row, col, QTableWidgetItem(value_str))
-        
-        self.details_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.details_model.set_rows(details)
 
     def clear_results(self):
-        """清空所有结果并禁用导出按钮。"""
-        while self.summary_layout.count():
-            item = self.summary_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        self.summary_layout.addRow(QLabel("请加载图像并开始分析..."))
-        self.details_table.setRowCount(0)
-        self.details_table.setColumnCount(0)
+        """清空所有结果并禁用导出按钮。
+
+        摘要行只被隐藏而不销毁，下次结果的键集合不变时可直接复用。
+        """
+        self._summary_form.setVisible(False)
+        self._dpi_widget.setVisible(False)
+        self._placeholder_label.setVisible(True)
+        self.details_model.set_rows([])
         self.export_csv_btn.setEnabled(False)
         self.export_word_btn.setEnabled(False)
         self.current_results = {}
@@ -159,11 +276,24 @@ class ResultPanel(QWidget):
         filepath, _ = QFileDialog.getSaveFileName(self, "保存CSV文件", "", "CSV Files (*.csv)")
         if not filepath: return
         
-        try:
-            Exporter.export_to_csv(details_data, filepath)
-        except Exception as e:
+        # 在线程池中逐行写出，导出期间界面保持响应
+        self._export_worker = _ExportWorker(
+            lambda: export_to_csv(details_data, filepath)
+        )
+        self._export_worker.signals.done.connect(self._on_export_csv_done)
+        self.export_csv_btn.setEnabled(False)
+        self.export_word_btn.setEnabled(False)
+        QThreadPool.globalInstance().start(self._export_worker)
+
+    def _on_export_csv_done(self, error: Optional[Exception]):
+        """CSV导出任务结束后恢复导出按钮。"""
+        self._export_worker = None
+        enabled = bool(self.current_results.get('measurements'))
+        self.export_csv_btn.setEnabled(enabled)
+        self.export_word_btn.setEnabled(enabled)
+        if error is not None:
             # 在未来版本中，这里应该显示一个错误对话框
-            print(f"导出CSV失败: {e}")
+            logger.error("导出CSV失败: %s", error)
 
     def _handle_export_word(self):
         """处理导出Word文档的逻辑。"""
@@ -173,14 +303,14 @@ class ResultPanel(QWidget):
         if not filepath: return
 
         try:
-            Exporter.export_to_word(
+            export_to_word(
                 summary_data=self.current_results.get('measurements', {}),
                 image_data=self.current_results.get('visualization'),
                 key_map=self.KEY_MAP,
                 filepath=filepath
             )
         except Exception as e:
-            print(f"导出Word失败: {e}")
+            logger.error("导出Word失败: %s", e)
 
     def update_dpi_info(self, dpi: Optional[tuple]):
         """在加载新图像时更新DPI信息并清空旧结果。"""
@@ -190,8 +320,9 @@ class ResultPanel(QWidget):
             x_dpi, y_dpi = dpi
             dpi_text = f"{x_dpi}" if x_dpi == y_dpi else f"X={x_dpi}, Y={y_dpi}"
         
-        self.summary_layout.addRow(QLabel("图像DPI:"), QLabel(dpi_text))
-        self.summary_layout.addRow(QLabel("状态:"), QLabel("请开始分析..."))
+        self._dpi_value_label.setText(dpi_text)
+        self._placeholder_label.setVisible(False)
+        self._dpi_widget.setVisible(True)
 
 # 移除旧的 update_results 方法，因为它被 update_analysis_results 替代了。
 # 为了简洁，这里直接注释掉了，但在实际编辑中会删除它。
@@ -17,7 +17,33 @@ class StyleManager:
     Attributes:
         _base_font_size (int): 基础字体大小，单位为像素
         _font_scale_factor (float): 字体缩放因子，用于整体调整字体大小
+        _cached_style (Optional[str]): 缓存的完整样式表，字体设置变化时失效
     """
+
+    # QSS模板，字面量花括号写作双花括号，在类定义时只构建一次
+    _BUTTON_TMPL = """
+            QPushButton {{
+                font-size: {font_size}px;
+                padding: 5px;
+            }}
+        """
+    _LABEL_TMPL = """
+            QLabel {{
+                font-size: {font_size}px;
+            }}
+        """
+    _TEXTEDIT_TMPL = """
+            QTextEdit {{
+                font-size: {font_size}px;
+            }}
+        """
+    _TITLE_TMPL = """
+            QLabel[title="true"] {{
+                font-size: {title_size}px;
+                font-weight: bold;
+            }}
+        """
+    _COMPLETE_TMPL = _BUTTON_TMPL + _LABEL_TMPL + _TEXTEDIT_TMPL + _TITLE_TMPL
     
     def __init__(self, base_font_size: int = 12, font_scale_factor: float = 1.0):
         """初始化样式管理器。
@@ -29,6 +55,7 @@ class StyleManager:
         self._base_font_size = base_font_size
         self._font_scale_factor = font_scale_factor
         self._style_sheets: Dict[str, str] = {}
+        self._cached_style: Optional[str] = None
         
     def set_font_scale_factor(self, scale_factor: float) -> None:
         """设置字体缩放因子。
@@ -37,6 +64,16 @@ class StyleManager:
             scale_factor (float): 新的字体缩放因子
         """
         self._font_scale_factor = scale_factor
+        self._cached_style = None
+
+    def set_base_font_size(self, base_font_size: int) -> None:
+        """设置基础字体大小。
+        
+        Args:
+            base_font_size (int): 新的基础字体大小，单位为像素
+        """
+        self._base_font_size = base_font_size
+        self._cached_style = None
         
     def get_scaled_font_size(self) -> int:
         """获取经过缩放的字体大小。
@@ -52,13 +89,7 @@ class StyleManager:
         Returns:
             str: 按钮的样式表字符串
         """
-        font_size = self.get_scaled_font_size()
-        return f"""
-            QPushButton {{
-                font-size: {font_size}px;
-                padding: 5px;
-            }}
-        """
+        return self._BUTTON_TMPL.format(font_size=self.get_scaled_font_size())
     
     def generate_label_style(self) -> str:
         """生成标签的样式表。
@@ -66,12 +97,7 @@ class StyleManager:
         Returns:
             str: 标签的样式表字符串
         """
-        font_size = self.get_scaled_font_size()
-        return f"""
-            QLabel {{
-                font-size: {font_size}px;
-            }}
-        """
+        return self._LABEL_TMPL.format(font_size=self.get_scaled_font_size())
     
     def generate_text_edit_style(self) -> str:
         """生成文本编辑器的样式表。
@@ -79,12 +105,7 @@ class StyleManager:
         Returns:
             str: 文本编辑器的样式表字符串
         """
-        font_size = self.get_scaled_font_size()
-        return f"""
-            QTextEdit {{
-                font-size: {font_size}px;
-            }}
-        """
+        return self._TEXTEDIT_TMPL.format(font_size=self.get_scaled_font_size())
     
     def generate_title_style(self) -> str:
         """生成标题的样式表。
@@ -92,41 +113,49 @@ class StyleManager:
         Returns:
             str: 标题的样式表字符串
         """
-        font_size = int(self.get_scaled_font_size() * 1.2)  # 标题字体稍大
-        return f"""
-            QLabel[title="true"] {{
-                font-size: {font_size}px;
-                font-weight: bold;
-            }}
-        """
+        return self._TITLE_TMPL.format(title_size=int(self.get_scaled_font_size() * 1.2))
     
     def generate_complete_style(self) -> str:
         """生成完整的样式表。
         
-        将所有样式组合成一个完整的样式表字符串。
+        将按钮、标签、文本编辑器和标题的样式合并为一个样式表字符串。结果会被缓存，
+        直到字体大小或缩放因子被修改。
         
         Returns:
             str: 完整的样式表字符串
         """
-        styles = [
-            self.generate_button_style(),
-            self.generate_label_style(),
-            self.generate_text_edit_style(),
-            self.generate_title_style()
-        ]
-        return "\n".join(styles)
+        if self._cached_style is None:
+            # 用预先拼接好的模板一次性生成单个QSS字符串
+            font_size = self.get_scaled_font_size()
+            self._cached_style = self._COMPLETE_TMPL.format(
+                font_size=font_size,
+                title_size=int(font_size * 1.2)  # 标题字体稍大
+            )
+        return self._cached_style
     
     def apply_style_to_widget(self, widget: QWidget) -> None:
         """将样式应用到指定的控件。
         
+        已不推荐使用，应通过 `apply_style_to_application` 在应用程序级别统一设置样式。
+        如果应用程序已使用相同的样式表，控件会直接继承它，此方法不做任何操作；
+        样式表未变化时同样跳过 setStyleSheet，避免Qt重新polish整个控件树。
+        
         Args:
             widget (QWidget): 要应用样式的控件
         """
-        widget.setStyleSheet(self.generate_complete_style())
+        style = self.generate_complete_style()
+        app = QApplication.instance()
+        if app is not None and app.styleSheet() == style:
+            return
+        if widget.styleSheet() != style:
+            widget.setStyleSheet(style)
     
     def apply_style_to_application(self) -> None:
         """将样式应用到整个应用程序。"""
-        QApplication.instance().setStyleSheet(self.generate_complete_style())
+        app = QApplication.instance()
+        style = self.generate_complete_style()
+        if app.styleSheet() != style:
+            app.setStyleSheet(style)
 
 
 # 创建全局样式管理器实例，默认字体大小为14px，缩放因子为1.5（增大50%）
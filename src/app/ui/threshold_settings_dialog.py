@@ -3,14 +3,16 @@
 提供一个独立的窗口，用于调整所有与阈值分割相关的参数。
 """
 
-from typing import Optional
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from PyQt5.QtCore import Qt, pyqtSignal as Signal, QTimer
+from PyQt5.QtCore import Qt, pyqtSignal as Signal, QTimer, QSignalBlocker
+from PyQt5.QtGui import QValidator
 from PyQt5.QtWidgets import (
-    QDialog,
     QWidget,
     QVBoxLayout,
-    QFormLayout,
+    QGridLayout,
     QGroupBox,
     QComboBox,
     QStackedWidget,
@@ -22,12 +24,69 @@ from PyQt5.QtWidgets import (
 
 from src.app.core.controller import Controller
 from src.app.utils.constants import StageKeys
+from .dialogs.base_parameter_dialog import BaseParameterDialog
 
-class ThresholdSettingsDialog(QDialog):
+logger = logging.getLogger(__name__)
+
+
+class OddSpinBox(QSpinBox):
+    """只接受奇数的SpinBox，用于块大小、窗口大小等参数。
+
+    输入偶数时视为未完成的输入，编辑结束后由 `fixup` 调整为相邻的奇数；
+    步进后的结果同样保证为奇数。与滑块之间可以直接连接 C++ 槽函数，
+    无需经过 Python 中转。
+    """
+
+    def _to_odd(self, value: int) -> int:
+        if value % 2:
+            return value
+        return value + 1 if value < self.maximum() else value - 1
+
+    def validate(self, text: str, pos: int):
+        state, text, pos = super().validate(text, pos)
+        if state == QValidator.Acceptable and self.valueFromText(text) % 2 == 0:
+            state = QValidator.Intermediate
+        return state, text, pos
+
+    def fixup(self, text: str) -> str:
+        return self.textFromValue(self._to_odd(self.valueFromText(text)))
+
+    def stepBy(self, steps: int):
+        super().stepBy(steps)
+        if self.value() % 2 == 0:
+            self.setValue(self._to_odd(self.value()))
+
+
+class ThresholdSettingsDialog(BaseParameterDialog):
     """用于设置阈值参数的对话框。"""
     
-    parameter_changed = Signal(str, object)
-    realtime_preview_requested = Signal(str)
+    # (阶段键, 缩放比例)
+    realtime_preview_requested = Signal(str, float)
+
+    # 显示数值的SpinBox名称 -> (阈值参数键, 默认值)
+    _SPINBOX_PARAMS = {
+        "threshold.global_value_spinbox": ("global_value", 128),
+        "threshold.adaptive_block_size": ("adaptive_block_size", 51),
+        "threshold.adaptive_c_value": ("adaptive_c_value", 2),
+        "threshold.window_size_spinbox": ("window_size", 51),
+        "threshold.k": ("k", 0.2),
+        "threshold.r_spinbox": ("r", 128),
+    }
+
+    # 调整期间提交参数并实时预览的最小间隔(毫秒)，按参数的计算代价区分；未列出的参数使用默认值
+    _PREVIEW_THROTTLE_MS = {
+        "threshold.global_value_spinbox": 50,
+        "threshold.window_size_spinbox": 300,
+        "threshold.k": 300,
+        "threshold.r_spinbox": 300,
+    }
+    _DEFAULT_PREVIEW_THROTTLE_MS = 150
+    # 停止调整后补发最后一次提交的延迟(毫秒)
+    _TRAILING_UPDATE_MS = 80
+    # 拖动滑块期间预览图像的缩放比例
+    _PREVIEW_DRAG_SCALE = 0.5
+    # 实时预览请求的阶段键，避免每次发射时访问枚举的 value
+    _BINARY_STAGE_KEY = StageKeys.BINARY.value
 
     def __init__(self, controller: Controller, parent: Optional[QWidget] = None):
         """初始化对话框。
@@ -36,11 +95,14 @@ class ThresholdSettingsDialog(QDialog):
             controller (Controller): 应用程序控制器实例。
             parent (Optional[QWidget]): 父窗口对象。
         """
-        super().__init__(parent)
-        self.controller = controller
+        super().__init__(controller, parent)
         
         self.setWindowTitle("调整二值化参数")
         self.setMinimumWidth(350)
+
+        # 参数页在 _init_ui 中即开始创建，其用到的状态必须先于UI初始化；
+        # 每个参数最近一次记录的值，值未变化的 valueChanged 不再触发参数更新和预览
+        self._last_values: Dict[str, Any] = {}
         
         self._init_ui()
         self._connect_signals()
@@ -57,228 +119,324 @@ class ThresholdSettingsDialog(QDialog):
         self.threshold_group = QGroupBox("阈值方法")
         layout = QVBoxLayout(self.threshold_group)
 
-        self.threshold_method_combo = QComboBox(objectName="threshold.method")
+        # 创建时登记所有参数控件，之后按名称直接访问，无需遍历对象树
+        self._param_widgets: Dict[str, QWidget] = {}
+        self._all_param_widgets: List[QWidget] = []
+        # 按控件类型分组，连接信号时无需再做类型判断
+        self._combos: List[QComboBox] = []
+        self._sliders: List[QSlider] = []
+        self._spinboxes: List[QWidget] = []  # QSpinBox 和 QDoubleSpinBox
+        # 滑块及其显示数值的SpinBox，用于同步时直接刷新滑块
+        self._slider_pairs: List[Tuple[QSlider, QSpinBox]] = []
+
+        self.threshold_method_combo = self._register(QComboBox(objectName="threshold.method"))
         self.threshold_method_map = {
             0: "adaptive_gaussian", 1: "otsu", 2: "global", 3: "niblack", 4: "sauvola"
         }
+        self._threshold_method_rev_map = {v: k for k, v in self.threshold_method_map.items()}
         self.threshold_method_combo.addItems([
             "自适应高斯 (Adaptive Gaussian)", "Otsu 自动阈值", "全局阈值 (Global)", "Niblack", "Sauvola"
         ])
         layout.addWidget(self.threshold_method_combo)
 
+        # 各方法的参数页在第一次显示时才创建，堆栈中先放置空白占位页
+        self._widget_factories: List[Callable[[], QWidget]] = [
+            self._create_adaptive_gaussian_widget,
+            QWidget,
+            self._create_global_threshold_widget,
+            lambda: self._create_niblack_sauvola_widget(is_sauvola=False),
+            lambda: self._create_niblack_sauvola_widget(is_sauvola=True),
+        ]
+        self._stack_pages: List[Optional[QWidget]] = [None] * len(self._widget_factories)
+        self._last_threshold_params: Dict[str, Any] = {}
         self.threshold_params_stack = QStackedWidget()
-        self.adaptive_widget = self._create_adaptive_gaussian_widget()
-        self.otsu_widget = QWidget() 
-        self.global_threshold_widget = self._create_global_threshold_widget()
-        self.niblack_widget = self._create_niblack_sauvola_widget(is_sauvola=False)
-        self.sauvola_widget = self._create_niblack_sauvola_widget(is_sauvola=True)
-        
-        self.threshold_params_stack.addWidget(self.adaptive_widget)
-        self.threshold_params_stack.addWidget(self.otsu_widget)
-        self.threshold_params_stack.addWidget(self.global_threshold_widget)
-        self.threshold_params_stack.addWidget(self.niblack_widget)
-        self.threshold_params_stack.addWidget(self.sauvola_widget)
+        for _ in self._widget_factories:
+            self.threshold_params_stack.addWidget(QWidget())
+        self._show_method_page(self.threshold_method_combo.currentIndex())
 
         layout.addWidget(self.threshold_params_stack)
 
+    def _ensure_page(self, index: int):
+        """确保指定方法的参数页已创建，必要时替换占位页。
+
+        新页面的控件先用最近一次同步的参数赋值，然后才连接到参数处理函数，
+        因此创建过程中不会向控制器发出任何参数变更。
+        """
+        if not 0 <= index < len(self._stack_pages) or self._stack_pages[index] is not None:
+            return
+        first_new_spinbox = len(self._spinboxes)
+        page = self._widget_factories[index]()
+        self._stack_pages[index] = page
+
+        placeholder = self.threshold_params_stack.widget(index)
+        self.threshold_params_stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self.threshold_params_stack.insertWidget(index, page)
+
+        new_spinboxes = self._spinboxes[first_new_spinbox:]
+        self._apply_spinbox_values(self._last_threshold_params, new_spinboxes)
+        for spinbox in new_spinboxes:
+            self._last_values.setdefault(spinbox.objectName(), spinbox.value())
+            spinbox.valueChanged.connect(self._on_parameter_changed)
+
+    def _show_method_page(self, index: int):
+        """切换到指定方法的参数页，首次访问时创建。"""
+        self._ensure_page(index)
+        self.threshold_params_stack.setCurrentIndex(index)
+
+    def _apply_spinbox_values(self, p_thresh: Dict[str, Any], spinboxes: List[QWidget]):
+        """按名称将阈值参数写入给定的SpinBox。"""
+        for spinbox in spinboxes:
+            param_key, default = self._SPINBOX_PARAMS[spinbox.objectName()]
+            self._set_if_changed(spinbox, p_thresh.get(param_key, default))
+
+    def _register(self, widget: QWidget) -> QWidget:
+        """登记一个参数控件并原样返回。
+
+        同名控件只保留第一个的名称索引，与 findChild 的行为一致。
+        """
+        name = widget.objectName()
+        self._param_widgets.setdefault(name, widget)
+        self._all_param_widgets.append(widget)
+        if isinstance(widget, QComboBox):
+            self._combos.append(widget)
+        else:
+            (self._sliders if isinstance(widget, QSlider) else self._spinboxes).append(widget)
+        return widget
+
+    def _pair_slider(self, slider: QSlider, spinbox: QSpinBox):
+        """记录滑块与SpinBox的配对，并建立双向连接。
+
+        Args:
+            slider (QSlider): 滑块控件。
+            spinbox (QSpinBox): 显示当前值的SpinBox。
+        """
+        self._slider_pairs.append((slider, spinbox))
+        slider.sliderPressed.connect(self._on_slider_pressed)
+        slider.sliderReleased.connect(self._on_slider_released)
+        slider.valueChanged.connect(spinbox.setValue)
+        spinbox.valueChanged.connect(slider.setValue)
+
+    @staticmethod
+    def _fill_grid(widget: QWidget, rows: List[Tuple[str, QWidget]]):
+        """用一个 QGridLayout 一次性排列参数页的 (标签文本, 控件) 行。"""
+        grid = QGridLayout(widget)
+        for row, (text, control) in enumerate(rows):
+            grid.addWidget(QLabel(text), row, 0)
+            grid.addWidget(control, row, 1)
+
     def _create_global_threshold_widget(self) -> QWidget:
-        widget = QWidget(); layout = QFormLayout(widget)
-        slider = QSlider(Qt.Horizontal, objectName="threshold.global_value"); slider.setRange(0, 255)
-        spinbox = QSpinBox(objectName="threshold.global_value_spinbox"); spinbox.setRange(0, 255)
+        widget = QWidget(); rows = []
+        slider = self._register(QSlider(Qt.Horizontal, objectName="threshold.global_value")); slider.setRange(0, 255)
+        spinbox = self._register(QSpinBox(objectName="threshold.global_value_spinbox")); spinbox.setRange(0, 255)
         
         # 建立双向连接
-        slider.valueChanged.connect(spinbox.setValue)
-        spinbox.valueChanged.connect(slider.setValue)
+        self._pair_slider(slider, spinbox)
         
-        layout.addRow("阈值:", slider)
-        layout.addRow("当前值:", spinbox)
+        rows.append(("阈值:", slider))
+        rows.append(("当前值:", spinbox))
+        self._fill_grid(widget, rows)
         return widget
 
     def _create_adaptive_gaussian_widget(self) -> QWidget:
-        widget = QWidget(); layout = QFormLayout(widget)
+        widget = QWidget(); rows = []
         
         # Block Size 控件组
-        bs_slider = QSlider(Qt.Horizontal, objectName="threshold.adaptive_block_size_slider")
+        bs_slider = self._register(QSlider(Qt.Horizontal, objectName="threshold.adaptive_block_size_slider"))
         bs_slider.setRange(3, 51); bs_slider.setSingleStep(2)
-        bs_spinbox = QSpinBox(objectName="threshold.adaptive_block_size")
+        # Block Size必须为奇数
+        bs_spinbox = self._register(OddSpinBox(objectName="threshold.adaptive_block_size"))
         bs_spinbox.setRange(3, 51); bs_spinbox.setSingleStep(2)
         
-        # 确保Block Size为奇数
-        def ensure_odd_bs(value):
-            if value % 2 == 0:
-                bs_spinbox.blockSignals(True)
-                bs_spinbox.setValue(value + 1)
-                bs_spinbox.blockSignals(False)
-                return value + 1
-            return value
-            
-        # 双向连接带奇数校验
-        bs_slider.valueChanged.connect(lambda v: bs_spinbox.setValue(ensure_odd_bs(v)))
-        bs_spinbox.valueChanged.connect(lambda v: bs_slider.setValue(ensure_odd_bs(v)))
+        # 双向连接
+        self._pair_slider(bs_slider, bs_spinbox)
         
-        layout.addRow("Block Size:", bs_slider)
-        layout.addRow("当前值:", bs_spinbox)
+        rows.append(("Block Size:", bs_slider))
+        rows.append(("当前值:", bs_spinbox))
         
         # C Value 控件组
-        c_slider = QSlider(Qt.Horizontal, objectName="threshold.adaptive_c_value_slider")
+        c_slider = self._register(QSlider(Qt.Horizontal, objectName="threshold.adaptive_c_value_slider"))
         c_slider.setRange(-10, 10)
-        c_spinbox = QSpinBox(objectName="threshold.adaptive_c_value")
+        c_spinbox = self._register(QSpinBox(objectName="threshold.adaptive_c_value"))
         c_spinbox.setRange(-10, 10)
         
         # 双向连接
-        c_slider.valueChanged.connect(c_spinbox.setValue)
-        c_spinbox.valueChanged.connect(c_slider.setValue)
+        self._pair_slider(c_slider, c_spinbox)
         
-        layout.addRow("C Value:", c_slider)
-        layout.addRow("当前值:", c_spinbox)
+        rows.append(("C Value:", c_slider))
+        rows.append(("当前值:", c_spinbox))
         
+        self._fill_grid(widget, rows)
         return widget
         
     def _create_niblack_sauvola_widget(self, is_sauvola: bool) -> QWidget:
-        widget = QWidget(); layout = QFormLayout(widget)
+        widget = QWidget(); rows = []
         
         # Window Size 控件组
-        ws_slider = QSlider(Qt.Horizontal, objectName="threshold.window_size")
+        ws_slider = self._register(QSlider(Qt.Horizontal, objectName="threshold.window_size"))
         ws_slider.setRange(3, 101); ws_slider.setSingleStep(2)
-        ws_spinbox = QSpinBox(objectName="threshold.window_size_spinbox")
+        # Window Size必须为奇数
+        ws_spinbox = self._register(OddSpinBox(objectName="threshold.window_size_spinbox"))
         ws_spinbox.setRange(3, 101); ws_spinbox.setSingleStep(2)
         
-        # 确保Window Size为奇数
-        def ensure_odd_ws(value):
-            if value % 2 == 0:
-                ws_spinbox.blockSignals(True)
-                ws_spinbox.setValue(value + 1)
-                ws_spinbox.blockSignals(False)
-                return value + 1
-            return value
-            
-        # 双向连接带奇数校验
-        ws_slider.valueChanged.connect(lambda v: ws_spinbox.setValue(ensure_odd_ws(v)))
-        ws_spinbox.valueChanged.connect(lambda v: ws_slider.setValue(ensure_odd_ws(v)))
+        # 双向连接
+        self._pair_slider(ws_slider, ws_spinbox)
         
-        layout.addRow("Window Size:", ws_slider)
-        layout.addRow("当前值:", ws_spinbox)
+        rows.append(("Window Size:", ws_slider))
+        rows.append(("当前值:", ws_spinbox))
 
         # K Value 控件组 (保持使用QDoubleSpinBox，因为需要小数)
-        k_spinbox = QDoubleSpinBox(objectName="threshold.k")
+        k_spinbox = self._register(QDoubleSpinBox(objectName="threshold.k"))
         k_spinbox.setRange(-2.0, 2.0); k_spinbox.setSingleStep(0.05)
-        layout.addRow("K Value:", k_spinbox)
+        rows.append(("K Value:", k_spinbox))
         
         # Sauvola特有的R Value控件组
         if is_sauvola:
-            r_slider = QSlider(Qt.Horizontal, objectName="threshold.r")
+            r_slider = self._register(QSlider(Qt.Horizontal, objectName="threshold.r"))
             r_slider.setRange(0, 255)
-            r_spinbox = QSpinBox(objectName="threshold.r_spinbox")
+            r_spinbox = self._register(QSpinBox(objectName="threshold.r_spinbox"))
             r_spinbox.setRange(0, 255)
             
             # 双向连接
-            r_slider.valueChanged.connect(r_spinbox.setValue)
-            r_spinbox.valueChanged.connect(r_slider.setValue)
+            self._pair_slider(r_slider, r_spinbox)
             
-            layout.addRow("R Value:", r_slider)
-            layout.addRow("当前值:", r_spinbox)
+            rows.append(("R Value:", r_slider))
+            rows.append(("当前值:", r_spinbox))
             
+        self._fill_grid(widget, rows)
         return widget
 
     def _init_preview_timer(self):
-        """初始化用于延迟实时预览的计时器。"""
-        self.preview_timer = QTimer(self)
-        self.preview_timer.setSingleShot(True)
-        # The timer now triggers a method that emits the correct stage key
-        self.preview_timer.timeout.connect(self._request_binary_preview)
+        """初始化节流所需的状态和尾随提交计时器。"""
+        # 上一次提交参数(并请求预览)的时间，用于节流
+        self._last_flush = 0.0
+        # 拖动滑块期间以降采样图像预览，松开后再以原始分辨率预览一次
+        self._is_dragging = False
+        self._last_preview_scale = 1.0
+
+        # 节流间隔内的变更先记在 _pending 中，停止调整后由该计时器补发最后一次
+        self._trailing_timer = QTimer(self)
+        self._trailing_timer.setSingleShot(True)
+        self._trailing_timer.setInterval(self._TRAILING_UPDATE_MS)
+        self._trailing_timer.timeout.connect(self._flush_pending)
 
     def _connect_signals(self):
-        self.threshold_method_combo.currentIndexChanged.connect(self.threshold_params_stack.setCurrentIndex)
+        self.threshold_method_combo.currentIndexChanged.connect(self._show_method_page)
         
         # 将所有参数控件的信号连接到处理函数
         # 我们只连接用户直接交互的控件，以避免双重信号
         
         # 1. 连接 ComboBox
-        self.threshold_method_combo.currentIndexChanged.connect(self._on_parameter_changed)
+        for combo in self._combos:
+            combo.currentIndexChanged.connect(self._on_parameter_changed)
 
-        # 2. 连接所有 SpinBox 和 DoubleSpinBox
-        for spinbox in self.findChildren((QSpinBox, QDoubleSpinBox)):
-            spinbox.valueChanged.connect(self._on_parameter_changed)
+        # 2. SpinBox 和 DoubleSpinBox 在所属参数页创建时由 _ensure_page 连接
         
         # 3. 连接所有 Slider (但它们的值变化不直接触发参数更新，而是通过SpinBox)
         # (双向绑定已在创建控件时完成)
 
     def _on_parameter_changed(self, value=None):
         sender = self.sender()
-        if not (sender and sender.objectName()): return
+        if sender is None: return
 
         param_path = sender.objectName()
-        
-        # [修复] 重新实现清晰的逻辑来获取值
+        # Niblack 与 Sauvola 页面存在同名控件，值必须取自发出信号的控件本身
         if isinstance(sender, QComboBox):
-            value = self.threshold_method_map.get(sender.currentIndex())
-        elif isinstance(sender, (QSlider, QDoubleSpinBox, QSpinBox)):
-            # SpinBox/Slider的值直接由信号传递
-            pass
+            value = self.threshold_method_map.get(value)
+
+        # 拖动滑块可能传入偶数：将SpinBox改为相邻奇数，
+        # 由此产生的 valueChanged 会同步滑块并再次进入本函数记录奇数值
+        if isinstance(sender, OddSpinBox) and value % 2 == 0:
+            sender.setValue(sender._to_odd(value))
+            return
+
+        if value is None or self._last_values.get(param_path) == value: return
+        self._last_values[param_path] = value
+        self._pending[param_path] = value
+
+        # 节流：距上次提交已超过最小间隔时立即提交并预览，拖动过程中也能看到中间结果；
+        # 否则(重新)启动尾随计时器，保证停止调整后总会以最终参数提交一次
+        interval_ms = max(
+            self._PREVIEW_THROTTLE_MS.get(path, self._DEFAULT_PREVIEW_THROTTLE_MS)
+            for path in self._pending
+        )
+        if (time.monotonic() - self._last_flush) * 1000 >= interval_ms:
+            self._trailing_timer.stop()
+            self._flush_pending()
         else:
-            return # Should not happen
-
-        # 确保窗口大小是奇数
-        if "block_size" in param_path and isinstance(value, int) and value % 2 == 0:
-            value += 1
-            # 临时阻止信号以避免递归设置
-            sender.blockSignals(True)
-            sender.setValue(value)
-            sender.blockSignals(False)
-
-        if value is not None:
-            print(f"[DEBUG Dialog] Parameter changed: {param_path} = {value}")
-            self.parameter_changed.emit(param_path, value)
-
-            # 检查是否需要触发实时预览
-            current_params = self.controller.get_current_parameters()
-            param_group = param_path.split('.')[0] # e.g., 'threshold'
-            
-            hints = current_params.get(param_group, {}).get('ui_hints', {})
-            print(f"[DEBUG Dialog] Checking ui_hints for realtime preview: {hints}")
-            if hints.get('realtime', False):
-                print(f"[DEBUG Dialog] Realtime hint is True. Starting preview timer.")
-                # 先停止计时器，确保多次快速变更只触发一次预览
-                self.preview_timer.stop()
-                self.preview_timer.start(500)
+            self._trailing_timer.start()
+
+    def _flush_pending(self):
+        """提交待定参数，并记录提交时间用于节流。"""
+        if self._pending:
+            self._last_flush = time.monotonic()
+        super()._flush_pending()
+
+    def _on_pending_flushed(self, pending: Dict[str, Any]):
+        """参数提交后，按需请求一次实时预览。"""
+        if self._wants_realtime_preview(pending):
+            self._request_binary_preview()
+
+    def _on_slider_pressed(self):
+        self._is_dragging = True
+
+    def _on_slider_released(self):
+        """结束拖动：立即提交待定参数，并确保最终只以原始分辨率预览一次。
+
+        有待提交参数时，提交本身就会(以原始分辨率)请求预览；
+        只有没有新参数而上次预览为降采样时，才单独补一次全分辨率预览。
+        """
+        self._is_dragging = False
+        self._trailing_timer.stop()
+        self._flush_pending()
+        if self._last_preview_scale < 1.0:
+            self._request_binary_preview()
 
     def _request_binary_preview(self):
-        """发射一个请求二值化阶段预览的信号。"""
-        self.realtime_preview_requested.emit(StageKeys.BINARY.value)
+        """发射 `realtime_preview_requested` 信号，请求一次二值化阶段预览。
+
+        拖动期间请求半分辨率预览，计算量约为原来的四分之一，其余情况按原始分辨率预览。
+        缩放比例随信号传递，只作用于这一次预览。
+        """
+        self._last_preview_scale = self._PREVIEW_DRAG_SCALE if self._is_dragging else 1.0
+        self.realtime_preview_requested.emit(self._BINARY_STAGE_KEY, self._last_preview_scale)
 
     def update_controls(self, params: dict):
         """根据给定的参数字典更新所有UI控件的值。"""
-        # 阻止所有信号，在设置完成后再恢复
-        self._block_all_signals(True)
-        try:
-            p_thresh = params.get('threshold', {})
-            if not p_thresh: return
+        self._cache_realtime_hints(params)
+        p_thresh = params.get('threshold', {})
+        if not p_thresh: return
+        self._last_threshold_params = p_thresh
 
+        method = p_thresh.get('method', 'adaptive_gaussian')
+        index = self._threshold_method_rev_map.get(method)
+        # 在阻止信号之前创建目标参数页，使新控件也处于下面的信号阻止范围内
+        if index is not None:
+            self._ensure_page(index)
+
+        # 用 QSignalBlocker 阻止所有参数控件的信号，设置完成后统一解除
+        blockers = [QSignalBlocker(widget) for widget in self._all_param_widgets]
+        try:
             # 1. 更新阈值方法下拉框
-            method = p_thresh.get('method', 'adaptive_gaussian')
-            for index, name in self.threshold_method_map.items():
-                if name == method:
-                    self.threshold_method_combo.setCurrentIndex(index)
-                    break
+            if index is not None and self.threshold_method_combo.currentIndex() != index:
+                self.threshold_method_combo.setCurrentIndex(index)
             
-            # 2. 更新所有参数控件的值
-            # 全局
-            self.findChild(QSpinBox, "threshold.global_value_spinbox").setValue(p_thresh.get('global_value', 128))
-            
-            # 自适应高斯
-            self.findChild(QSpinBox, "threshold.adaptive_block_size").setValue(p_thresh.get('adaptive_block_size', 51))
-            self.findChild(QSpinBox, "threshold.adaptive_c_value").setValue(p_thresh.get('adaptive_c_value', 2))
-
-            # Niblack / Sauvola
-            self.findChild(QSpinBox, "threshold.window_size_spinbox").setValue(p_thresh.get('window_size', 51))
-            self.findChild(QDoubleSpinBox, "threshold.k").setValue(p_thresh.get('k', 0.2))
-            self.findChild(QSpinBox, "threshold.r_spinbox").setValue(p_thresh.get('r', 128))
+            # 2. 更新所有已创建参数控件的值
+            self._apply_spinbox_values(p_thresh, self._spinboxes)
+
+            # 3. 信号被阻止时双向绑定不会生效，直接同步滑块和参数页，
+            #    而不是重新发射信号（那会把每个参数再发回控制器一次）
+            for slider, spinbox in self._slider_pairs:
+                self._set_if_changed(slider, int(spinbox.value()))
+            self.threshold_params_stack.setCurrentIndex(self.threshold_method_combo.currentIndex())
+
+            # 4. 以控件当前值作为比较基准，后续相同值的信号会被忽略
+            self._last_values = {spinbox.objectName(): spinbox.value() for spinbox in self._spinboxes}
+            self._last_values[self.threshold_method_combo.objectName()] = self.threshold_method_map.get(
+                self.threshold_method_combo.currentIndex()
+            )
             
         finally:
-            self._block_all_signals(False)
-
-    def _block_all_signals(self, block: bool):
-        """阻止或恢复所有参数控件的信号。"""
-        widgets = self.findChildren((QComboBox, QSlider, QDoubleSpinBox, QSpinBox))
-        for widget in widgets:
-            widget.blockSignals(block) 
\ No newline at end of file
+            for blocker in blockers:
+                blocker.unblock()
+            del blockers
@@ -1,92 +1,140 @@
 """导出工具模块。
 
-该模块提供了将分析结果导出为不同文件格式（如CSV、Word）的静态方法。
+该模块提供了将分析结果导出为不同文件格式（如CSV、Word）的函数。
 它将导出逻辑与UI层分离，提高了代码的模块化和可维护性。
 """
 
+import csv
 import io
-import pandas as pd
+import os
+import cv2
 from docx import Document
 from docx.shared import Inches
-from PIL import Image
 import numpy as np
-from typing import Dict, List, Any
+from typing import Callable, Dict, Any, List
 
-class Exporter:
+
+# Word文档中直接生成表格的最大详细数据行数，超过时改为另存CSV
+WORD_TABLE_MAX_ROWS = 500
+
+# 按值的类型选择格式化函数，浮点数保留四位小数，其它类型使用 str
+_FLOAT_FORMAT: Callable[[Any], str] = "{:.4f}".format
+_FORMATTERS: Dict[type, Callable[[Any], str]] = {
+    float: _FLOAT_FORMAT,
+    np.float64: _FLOAT_FORMAT,
+    np.float32: _FLOAT_FORMAT,
+}
+
+
+def _collect_headers(rows: List[Dict[str, Any]]) -> List[str]:
+    """按首次出现的顺序返回所有行中键的并集。"""
+    return list(dict.fromkeys(key for row in rows for key in row))
+
+
+def export_to_csv(details_data: List[Dict[str, Any]], filepath: str) -> None:
+    """将详细数据逐行写入CSV文件。
+
+    表头为所有行中键的并集（按首次出现的顺序），某行缺少的列留空。
+    行直接从传入的列表写出，不复制数据。
+
+    Args:
+        details_data (List[Dict[str, Any]]): 包含详细测量结果的字典列表。
+        filepath (str): 保存CSV文件的路径。
+    """
+    if not details_data:
+        raise ValueError("无法导出空的详细数据。")
+
+    with open(filepath, 'w', newline='', encoding='utf-8-sig') as f:
+        writer = csv.DictWriter(f, fieldnames=_collect_headers(details_data))
+        writer.writeheader()
+        writer.writerows(details_data)
+
+
+def _format_column(values: List[Any]) -> np.ndarray:
+    """将一列数值格式化为字符串数组。
+
+    全部为浮点数的列一次性以 "%.4f" 格式化；其它列（包括混有整数、None
+    或轮廓数组等非标量值的列）按每个值的类型查表选择格式化函数。
+
+    Args:
+        values (List[Any]): 同一列中按行排列的值。
+
+    Returns:
+        np.ndarray: 与输入等长的字符串数组。
     """
-    一个包含各种导出功能的静态工具类。
+    # 只看首行会把后续的整数或布尔值也格式化成 "2.0000"，因此逐个检查类型
+    if values and all(type(value) in _FORMATTERS for value in values):
+        return np.char.mod('%.4f', np.asarray(values, dtype=np.float64))
+    return np.array(
+        [_FORMATTERS.get(type(value), str)(value) for value in values],
+        dtype=object,
+    )
+
+
+def export_to_word(
+    summary_data: Dict[str, Any], 
+    image_data: np.ndarray, 
+    key_map: Dict[str, str], 
+    filepath: str
+) -> None:
+    """将完整的分析结果（摘要、详情、图像）导出为Word文档。
+
+    详细数据超过 WORD_TABLE_MAX_ROWS 行时不在文档中生成表格，而是写入
+    与文档同名的 "_details.csv" 文件，并在文档中注明其路径。
+
+    Args:
+        summary_data (Dict[str, Any]): 包含摘要和详细信息的测量结果字典。
+        image_data (np.ndarray): 用于可视化的结果图像 (BGR格式)。
+        key_map (Dict[str, str]): 用于将程序键名翻译为用户友好标签的字典。
+        filepath (str): 保存Word文档的路径。
     """
-    @staticmethod
-    def export_to_csv(details_data: List[Dict[str, Any]], filepath: str) -> None:
-        """将详细数据导出为CSV文件。
-
-        Args:
-            details_data (List[Dict[str, Any]]): 包含详细测量结果的字典列表。
-            filepath (str): 保存CSV文件的路径。
-        """
-        if not details_data:
-            raise ValueError("无法导出空的详细数据。")
-        
-        details_df = pd.DataFrame(details_data)
-        details_df.to_csv(filepath, index=False, encoding='utf-8-sig')
-
-    @staticmethod
-    def export_to_word(
-        summary_data: Dict[str, Any], 
-        image_data: np.ndarray, 
-        key_map: Dict[str, str], 
-        filepath: str
-    ) -> None:
-        """将完整的分析结果（摘要、详情、图像）导出为Word文档。
-
-        Args:
-            summary_data (Dict[str, Any]): 包含摘要和详细信息的测量结果字典。
-            image_data (np.ndarray): 用于可视化的结果图像。
-            key_map (Dict[str, str]): 用于将程序键名翻译为用户友好标签的字典。
-            filepath (str): 保存Word文档的路径。
-        """
-        doc = Document()
-        doc.add_heading('岩心分析结果报告', level=1)
-
-        # 添加摘要
-        doc.add_heading('分析摘要', level=2)
-        for key, value in summary_data.items():
-            if key == 'details': continue
-            label = key_map.get(key, key)
-            if isinstance(value, float):
-                value_str = f"{value:.4f}"
-            else:
-                value_str = str(value)
-            doc.add_paragraph(f"{label}: {value_str}")
-
-        # 添加详细数据表格
-        doc.add_heading('详细数据', level=2)
-        details_data = summary_data.get('details', [])
-        if details_data:
-            headers = list(details_data[0].keys())
-            table = doc.add_table(rows=1, cols=len(headers))
-            table.style = 'Table Grid'
-            hdr_cells = table.rows[0].cells
-            for i, h in enumerate(headers):
-                hdr_cells[i].text = key_map.get(h, h)
-
-            for item in details_data:
-                row_cells = table.add_row().cells
-                for i, key in enumerate(headers):
-                    value = item.get(key)
-                    if isinstance(value, float):
-                        value_str = f"{value:.4f}"
-                    else:
-                        value_str = str(value)
-                    row_cells[i].text = value_str
-
-        # 添加可视化图像
-        doc.add_heading('可视化结果', level=2)
-        if image_data is not None:
-            pil_img = Image.fromarray(image_data)
-            img_stream = io.BytesIO()
-            pil_img.save(img_stream, format='PNG')
-            img_stream.seek(0)
-            doc.add_picture(img_stream, width=Inches(6.0))
-
-        doc.save(filepath) 
\ No newline at end of file
+    doc = Document()
+    doc.add_heading('岩心分析结果报告', level=1)
+
+    # 添加摘要
+    doc.add_heading('分析摘要', level=2)
+    for key, value in summary_data.items():
+        if key == 'details': continue
+        label = key_map.get(key, key)
+        value_str = _FORMATTERS.get(type(value), str)(value)
+        doc.add_paragraph(f"{label}: {value_str}")
+
+    # 添加详细数据表格
+    doc.add_heading('详细数据', level=2)
+    details_data = summary_data.get('details', [])
+    if len(details_data) > WORD_TABLE_MAX_ROWS:
+        # python-docx 逐行扩展表格的开销随行数迅速增长，大表改为单独的CSV文件
+        csv_path = os.path.splitext(filepath)[0] + '_details.csv'
+        export_to_csv(details_data, csv_path)
+        doc.add_paragraph(f"详细数据共 {len(details_data)} 行，已导出至 {csv_path}")
+    elif details_data:
+        headers = _collect_headers(details_data)
+        # 一次性创建全部行，避免逐行 add_row
+        table = doc.add_table(rows=1 + len(details_data), cols=len(headers))
+        table.style = 'Table Grid'
+        rows = table.rows
+        hdr_cells = rows[0].cells
+        for i, h in enumerate(headers):
+            hdr_cells[i].text = key_map.get(h, h)
+
+        # 按列一次性格式化，再逐行填入单元格
+        columns = [
+            _format_column([item.get(key) for item in details_data])
+            for key in headers
+        ]
+        for row_idx in range(len(details_data)):
+            row_cells = rows[row_idx + 1].cells
+            for i, column in enumerate(columns):
+                row_cells[i].text = str(column[row_idx])
+
+    # 添加可视化图像
+    doc.add_heading('可视化结果', level=2)
+    if image_data is not None:
+        # 直接由OpenCV从ndarray编码PNG，较低的压缩级别换取更快的编码
+        ok, png_buf = cv2.imencode('.png', image_data, [cv2.IMWRITE_PNG_COMPRESSION, 3])
+        if not ok:
+            raise ValueError("无法将结果图像编码为PNG。")
+        img_stream = io.BytesIO(png_buf.tobytes())
+        doc.add_picture(img_stream, width=Inches(6.0))
+
+    doc.save(filepath) 
\ No newline at end of file
@@ -0,0 +1,32 @@
+"""pytest 共享配置。
+
+需要Qt控件的测试模块通过 `pytestmark = pytest.mark.usefixtures("qapp")`
+共用一个会话级的 QApplication 实例，避免各测试模块重复创建
+（重复创建会报错或浪费初始化时间）。该实例默认运行在 offscreen 平台上，
+不依赖显示设备。PyQt5 只在该 fixture 中导入，纯Python的测试不依赖它。
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# 确保无论从哪个目录运行，都能以 src.app... 的形式导入被测代码；
+# 项目根目录只在尚未存在时加入 sys.path，各测试模块不再重复插入
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# 测试无需真实显示设备：默认使用 offscreen 平台插件并关闭Qt调试日志，
+# 省去连接显示服务的开销；已显式设置的环境变量保持不变
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("QT_LOGGING_RULES", "*.debug=false")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """返回整个测试会话共享的 QApplication 实例；未安装 PyQt5 时跳过相关测试。"""
+    QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    yield app
@@ -1,14 +1,16 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
-from PyQt5.QtWidgets import QApplication, QWidget
+import pytest
 
-# We need a QApplication instance for any widget tests
-app = QApplication([])
+from PyQt5.QtWidgets import QWidget
 
 from src.app.ui.control_panel import ControlPanel
 from src.app.ui.parameter_panels.fracture_params_panel import FractureParamsPanel
 
+# 共用 tests/conftest.py 中会话级的 QApplication 实例
+pytestmark = pytest.mark.usefixtures("qapp")
+
 
 class MockFracturePanel(FractureParamsPanel):
     """一个用于测试的、真正的QWidget子类，但其方法可以被模拟。"""
@@ -27,7 +29,7 @@ class TestArchitectureWiring(unittest.TestCase):
     测试新的解耦架构中，UI组件之间的信号-槽连接是否正确。
     """
 
-    @patch('src.app.ui.control_panel.FractureParamsPanel', new=MockFracturePanel)
+    @patch.dict(ControlPanel.PANEL_CLASSES, {'fracture': MockFracturePanel})
     def test_control_panel_connects_signal_to_controller_slot(self):
         """
         验证当分析模式切换时，ControlPanel是否正确地将
@@ -42,7 +44,7 @@ class TestArchitectureWiring(unittest.TestCase):
         mock_controller.analyzers_registered.connect = MagicMock()
 
         # 2. 操作 (Act)
-        # 创建 ControlPanel 实例。@patch会确保它使用我们的MockFracturePanel
+        # 创建 ControlPanel 实例。@patch.dict会确保它使用我们的MockFracturePanel
         panel = ControlPanel(controller=mock_controller)
 
         # 手动调用模式切换方法，模拟用户操作
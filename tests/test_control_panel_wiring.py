@@ -1,39 +1,54 @@
 import unittest
-from unittest.mock import Mock, MagicMock
-import sys
+from unittest.mock import Mock, MagicMock, patch
 
-from PyQt5.QtWidgets import QApplication
+import pytest
 
-# 确保在测试环境中可以找到src目录
-sys.path.insert(0, '.')
+from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtWidgets import QWidget
 
 from src.app.core.controller import Controller
 from src.app.ui.control_panel import ControlPanel
-from src.app.ui.parameter_panels.fracture_params_panel import FractureParamsPanel
+
+# 共用 tests/conftest.py 中会话级的 QApplication 实例
+pytestmark = pytest.mark.usefixtures("qapp")
+
+
+class _StubPanel(QWidget):
+    """只声明参数面板信号接口的轻量面板，不创建任何子控件。"""
+
+    parameter_changed = pyqtSignal(str, object)
+    realtime_preview_requested = pyqtSignal(str, float)
+
+    def __init__(self, controller):
+        super().__init__()
+        self.controller = controller
+
+    def on_parameters_updated(self, params):
+        pass
+
 
 class TestControlPanelWiring(unittest.TestCase):
     """
     测试ControlPanel是否能正确地将参数面板的信号连接到控制器的槽。
     """
-    @classmethod
-    def setUpClass(cls):
-        """为所有测试创建一个共享的QApplication实例。"""
-        cls.app = QApplication(sys.argv)
-
+    @patch.dict(ControlPanel.PANEL_CLASSES, {'fracture': _StubPanel})
     def test_fracture_panel_signal_is_wired_to_controller(self):
         """
-        验证当FractureParamsPanel被加载时，其parameter_changed信号
+        验证当裂缝分析的参数面板被加载时，其parameter_changed信号
         被成功连接到controller.update_parameter方法。
+
+        面板类被替换为只有信号的 _StubPanel，避免构建完整的控件树。
         """
         # 1. 准备
         controller = Controller()
         # 使用Mock替换真实的方法以便于断言
         controller.update_parameter = MagicMock()
+        controller.request_realtime_preview = MagicMock()
         
         control_panel = ControlPanel(controller)
         
         # 2. 触发动作
-        # 手动触发模式切换，这会加载FractureParamsPanel
+        # 手动触发模式切换，这会加载裂缝分析的参数面板
         control_panel._on_mode_changed(0) 
         
         # 从堆叠窗口中获取被加载的面板实例
@@ -41,8 +56,8 @@ class TestControlPanelWiring(unittest.TestCase):
         
         self.assertIsInstance(
             loaded_panel, 
-            FractureParamsPanel,
-            "加载的面板不是FractureParamsPanel的实例"
+            _StubPanel,
+            "加载的面板不是映射表中登记的面板类的实例"
         )
         
         # 定义要发送的测试数据
@@ -56,5 +71,9 @@ class TestControlPanelWiring(unittest.TestCase):
         # 验证被Mock的controller.update_parameter方法是否被调用
         controller.update_parameter.assert_called_once_with(test_key, test_value)
 
+        # 预览请求连同缩放比例一起转发给控制器
+        loaded_panel.realtime_preview_requested.emit('binary', 0.5)
+        controller.request_realtime_preview.assert_called_once_with('binary', 0.5)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -6,142 +6,175 @@
 """
 
 import unittest
-import json
+import copy
+import io
 import os
-from unittest.mock import MagicMock, patch
+import tempfile
+from unittest.mock import patch
+
 import numpy as np
+import pytest
 
-# 将src目录添加到sys.path以进行绝对导入
-import sys
-# 确保即使从tests目录运行，也能找到src
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.app.core.controller import Controller
 
-# 在导入PyQt之前，模拟/创建 QApplication
-from PyQt5.QtWidgets import QApplication
-# 防止在CI/CD或无头环境中运行测试时出错
-if QApplication.instance() is None:
-    app = QApplication(sys.argv)
+# 共用 tests/conftest.py 中会话级的 QApplication 实例
+pytestmark = pytest.mark.usefixtures("qapp")
+
+
+class _FakeAnalyzer:
+    """手写的分析器替身，返回固定结果并记录每次调用收到的参数。
+
+    比 MagicMock 轻量：没有自动生成的子对象和调用记录机制。
+    """
+
+    def __init__(self):
+        self.calls = {'run_analysis': [], 'post_process_measurements': []}
+
+    def get_id(self):
+        return 'fracture'
+
+    def run_analysis(self, image, params, dpi=0.0):
+        self.calls['run_analysis'].append((params, dpi))
+        return {'count': 1}
+
+    def post_process_measurements(self, results, dpi):
+        self.calls['post_process_measurements'].append(dpi)
+        return dict(results, unit='mm')
 
-from src.app.core.controller import Controller
-from src.app.core.analysis_stages import AnalysisStage
 
 class TestControllerParams(unittest.TestCase):
-    """测试Controller类的新增参数管理功能。"""
+    """测试Controller类的参数管理和分析调度功能。"""
+
+    @classmethod
+    def setUpClass(cls):
+        """只解析一次默认参数文件，并创建所有测试共用的Controller实例。
+
+        各测试用例在 setUp 中重置参数；需要修改其它状态的测试
+        使用 patch.object 作用于该实例，测试结束后自动恢复。
+        """
+        cls.controller = Controller()
+        cls._default_params = copy.deepcopy(cls.controller.default_params)
 
     def setUp(self):
-        """为每个测试用例设置一个新的Controller实例。"""
-        self.controller = Controller()
-        
-        # 确保有一个默认的参数结构
-        self.controller._load_default_parameters()
-        
-        # 创建一个临时文件用于测试保存和加载
-        self.temp_params_file = "temp_test_params.json"
-
-    def tearDown(self):
-        """在每个测试用例后清理临时文件。"""
-        if os.path.exists(self.temp_params_file):
-            os.remove(self.temp_params_file)
+        """重置共享Controller的参数，并让测试中新建的Controller使用缓存的默认参数。"""
+        # 用缓存的默认参数代替 Controller 初始化时对 JSON 文件的重复解析
+        default_params = self._default_params
+        patcher = patch.object(
+            Controller, "_load_all_default_params",
+            lambda controller: setattr(controller, "default_params", copy.deepcopy(default_params)),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # 恢复当前激活分析器的默认参数
+        analyzer_id = self.controller.get_current_analyzer_id()
+        self.controller.analysis_params = copy.deepcopy(self._default_params[analyzer_id])
 
     def test_load_default_parameters_exists_and_has_keys(self):
         """测试: Controller初始化时，默认参数是否成功加载并包含必要的键。"""
-        self.assertIsNotNone(self.controller.analysis_params)
-        self.assertIn("version", self.controller.analysis_params)
-        self.assertIn("analysis_parameters", self.controller.analysis_params)
-        self.assertIn("threshold", self.controller.analysis_params["analysis_parameters"])
+        self.assertIn("fracture", self.controller.default_params)
+        self.assertEqual(self.controller.get_current_analyzer_id(), "fracture")
+        self.assertIn("threshold", self.controller.get_current_parameters())
 
     def test_update_parameter_modifies_nested_value(self):
         """测试: update_parameter 是否能正确修改一个嵌套的参数值。"""
         new_block_size = 25
         self.controller.update_parameter("threshold.block_size", new_block_size)
-        
-        retrieved_block_size = self.controller.analysis_params["analysis_parameters"]["threshold"]["block_size"]
+
+        retrieved_block_size = self.controller.analysis_params["threshold"]["block_size"]
         self.assertEqual(retrieved_block_size, new_block_size)
 
     def test_save_and_load_parameters_e2e(self):
-        """测试: save_parameters 和 load_parameters 的端到端功能。"""
-        # 1. 修改一个参数并保存
+        """测试: save_parameters 和 load_parameters 通过文件对象的端到端功能。"""
+        # 1. 修改一个参数并保存到内存中的文件对象
         self.controller.update_parameter("filtering.min_length_mm", 99.9)
-        self.controller.save_parameters(self.temp_params_file)
-        
-        self.assertTrue(os.path.exists(self.temp_params_file))
+        params_buffer = io.StringIO()
+        self.controller.save_parameters(params_buffer)
+
+        # 传入的文件对象由调用方负责关闭
+        self.assertFalse(params_buffer.closed)
+        self.assertTrue(params_buffer.getvalue())
+        params_buffer.seek(0)
 
         # 2. 创建一个新的控制器实例来加载
         new_controller = Controller()
-        
-        # 模拟信号发射
-        new_controller.parameters_updated = MagicMock()
-        
-        new_controller.load_parameters(self.temp_params_file)
+        emitted = []
+        new_controller.parameters_updated.connect(emitted.append)
+
+        new_controller.load_parameters(params_buffer)
 
         # 3. 验证加载的参数是否正确，以及信号是否被发射
-        loaded_value = new_controller.analysis_params["analysis_parameters"]["filtering"]["min_length_mm"]
+        loaded_value = new_controller.analysis_params["filtering"]["min_length_mm"]
         self.assertEqual(loaded_value, 99.9)
-        new_controller.parameters_updated.emit.assert_called_once()
-        
+        self.assertEqual(len(emitted), 1)
+
+    def test_save_and_load_parameters_by_path(self):
+        """测试: save_parameters 和 load_parameters 仍支持文件路径。"""
+        self.controller.update_parameter("threshold.k", -0.3)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            params_path = os.path.join(tmp_dir, "params.json")
+            self.controller.save_parameters(params_path)
+
+            new_controller = Controller()
+            new_controller.load_parameters(params_path)
+
+        self.assertEqual(new_controller.analysis_params["threshold"]["k"], -0.3)
+
     def test_update_new_parameters(self):
-        """测试: update_parameter 是否能正确修改新增的嵌套参数值。"""
-        # 测试 Niblack k 值
-        new_niblack_k = -0.5
-        self.controller.update_parameter("threshold.niblack_k", new_niblack_k)
-        retrieved_niblack_k = self.controller.analysis_params["analysis_parameters"]["threshold"]["niblack_k"]
-        self.assertEqual(retrieved_niblack_k, new_niblack_k)
+        """测试: update_parameter 是否能正确修改各参数组的嵌套参数值。"""
+        # 测试 Niblack/Sauvola 的 k 值
+        new_k = -0.5
+        self.controller.update_parameter("threshold.k", new_k)
+        self.assertEqual(self.controller.analysis_params["threshold"]["k"], new_k)
 
         # 测试 Sauvola r 值
-        new_sauvola_r = 100
-        self.controller.update_parameter("threshold.sauvola_r", new_sauvola_r)
-        retrieved_sauvola_r = self.controller.analysis_params["analysis_parameters"]["threshold"]["sauvola_r"]
-        self.assertEqual(retrieved_sauvola_r, new_sauvola_r)
+        new_r = 100
+        self.controller.update_parameter("threshold.r", new_r)
+        self.assertEqual(self.controller.analysis_params["threshold"]["r"], new_r)
 
         # 测试形态学迭代次数
         new_open_iterations = 5
         self.controller.update_parameter("morphology.open_iterations", new_open_iterations)
-        retrieved_open_iterations = self.controller.analysis_params["analysis_parameters"]["morphology"]["open_iterations"]
-        self.assertEqual(retrieved_open_iterations, new_open_iterations)
-
-    @patch('src.app.core.controller.ImageProcessor')
-    def test_full_analysis_pipeline_with_mocked_processor(self, MockImageProcessor):
-        """测试: 完整分析流程中，参数是否被正确传递给ImageProcessor。"""
-        # 准备: 模拟 ImageProcessor 实例和它的方法
-        mock_processor_instance = MockImageProcessor.return_value
-        mock_processor_instance.analyze_fractures.return_value = [{'dummy': 'fracture'}]
-        mock_processor_instance.merge_fractures.return_value = [{'area_pixels': 1, 'length_pixels': 1, 'angle': 1}]
-        mock_processor_instance.draw_analysis_results.return_value = 'final_image'
-
-        # 将模拟的处理器实例注入到控制器中
-        self.controller.image_processor = mock_processor_instance
-        
-        # 准备: 设置分析所需的前置状态
-        self.controller.current_dpi = (25.4, 25.4) # 1 mm = 1 pixel
-        self.controller.analysis_results[AnalysisStage.MORPHOLOGY] = {'image': 'dummy_binary_image'}
-        self.controller.analysis_results[AnalysisStage.ORIGINAL] = {'image': 'dummy_original_image'}
+        self.assertEqual(self.controller.analysis_params["morphology"]["open_iterations"], new_open_iterations)
+
+    def test_full_analysis_pipeline_with_fake_analyzer(self):
+        """测试: 完整分析流程中，参数是否经单位换算后传递给分析器。"""
+        # 准备: 将假分析器和分析所需的前置状态注入到共享控制器中，测试结束后恢复
+        fake_analyzer = _FakeAnalyzer()
+        for name, value in (
+            ('active_analyzer', fake_analyzer),
+            ('current_image', np.zeros((8, 8, 3), dtype=np.uint8)),
+            ('current_dpi', (25.4, 25.4)), # 1 mm = 1 pixel
+        ):
+            patcher = patch.object(self.controller, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
 
         # 准备: 设置自定义参数
         test_aspect_ratio = 20.0
-        test_merge_dist_mm = 5.0
-        test_angle_diff = 30.0
+        test_min_length_mm = 5.0
         self.controller.update_parameter("filtering.min_aspect_ratio", test_aspect_ratio)
-        self.controller.update_parameter("merging.enabled", True)
-        self.controller.update_parameter("merging.merge_distance_mm", test_merge_dist_mm)
-        self.controller.update_parameter("merging.max_angle_diff", test_angle_diff)
-        
+        self.controller.update_parameter("filtering.min_length_mm", test_min_length_mm)
+
+        results = []
+        self.controller.analysis_complete.connect(results.append)
+        self.addCleanup(self.controller.analysis_complete.disconnect, results.append)
+
         # 执行
-        self.controller.run_fracture_analysis()
+        self.controller.run_full_analysis()
 
-        # 验证: analyze_fractures 是否被正确调用
-        mock_processor_instance.analyze_fractures.assert_called_once()
-        _, kwargs_analyze = mock_processor_instance.analyze_fractures.call_args
-        self.assertEqual(kwargs_analyze.get('min_aspect_ratio'), test_aspect_ratio)
+        # 验证: 分析器恰好被调用一次，并收到了自定义参数和换算后的像素长度
+        (analysis_params, dpi), = fake_analyzer.calls['run_analysis']
+        self.assertEqual(dpi, 25.4)
+        self.assertEqual(analysis_params['filtering']['min_aspect_ratio'], test_aspect_ratio)
+        self.assertAlmostEqual(analysis_params['filtering']['min_length_pixels'], test_min_length_mm)
+        # 换算结果只写入传给分析器的副本
+        self.assertNotIn('min_length_pixels', self.controller.analysis_params['filtering'])
 
-        # 验证: merge_fractures 是否被正确调用
-        mock_processor_instance.merge_fractures.assert_called_once()
-        _, kwargs_merge = mock_processor_instance.merge_fractures.call_args
-        self.assertEqual(kwargs_merge.get('max_distance'), test_merge_dist_mm) # 1mm = 1px, so 5.0
-        self.assertEqual(kwargs_merge.get('max_angle_diff'), test_angle_diff)
-        
-        # 验证: draw_analysis_results 是否被正确调用
-        mock_processor_instance.draw_analysis_results.assert_called_once()
+        # 验证: 结果经过单位后处理后发出
+        self.assertEqual(fake_analyzer.calls['post_process_measurements'], [25.4])
+        self.assertEqual(results, [{'count': 1, 'unit': 'mm'}])
 
 
 if __name__ == '__main__':
-    unittest.main() 
\ No newline at end of file
+    unittest.main()
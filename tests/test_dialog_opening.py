@@ -2,72 +2,71 @@
 # -*- coding: utf-8 -*-
 
 """
-测试控制面板上的按钮是否能正确打开对话框。
+测试裂缝参数面板上的按钮是否能正确打开对话框。
+
+各对话框类在面板的槽函数中按需导入，因此 patch 的目标是对话框所在的模块，
+而不是面板模块。
 """
 
 import unittest
 from unittest.mock import patch, MagicMock
 
-# 将src目录添加到sys.path以进行绝对导入
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-# 在导入PyQt之前，模拟 QApplication
-from PyQt5.QtWidgets import QApplication
-app = QApplication(sys.argv)
+import pytest
 
-from src.app.ui.control_panel import ControlPanel
+from src.app.ui.parameter_panels.fracture_params_panel import FractureParamsPanel
 from src.app.core.controller import Controller
 
+# 共用 tests/conftest.py 中会话级的 QApplication 实例
+pytestmark = pytest.mark.usefixtures("qapp")
+
+
 class TestDialogOpening(unittest.TestCase):
-    """测试ControlPanel中按钮打开对话框的功能。"""
+    """测试FractureParamsPanel中按钮打开对话框的功能。"""
 
     def setUp(self):
         """设置测试环境。"""
-        # 模拟Controller和QObject的初始化
-        with patch('PyQt5.QtCore.QObject.__init__'):
-            self.mock_controller = Controller()
-        
-        # 模拟parameters_updated信号
-        self.mock_controller.parameters_updated = MagicMock()
-        
-        # 创建待测试的ControlPanel实例
-        self.control_panel = ControlPanel(self.mock_controller)
+        # 这些测试只需要Controller的属性接口，以 spec 限定的模拟对象代替真实实例，
+        # 不执行 Controller.__init__ 中加载默认参数、注册分析器等工作
+        self.mock_controller = MagicMock(spec=Controller)
+        self.mock_controller.get_current_parameters.return_value = {}
+
+        # 每个测试使用新的参数面板，保证对话框缓存从空状态开始
+        self.params_panel = FractureParamsPanel(self.mock_controller)
+        self.addCleanup(self.params_panel.deleteLater)
 
-    @patch('src.app.ui.control_panel.ThresholdSettingsDialog')
+    @patch('src.app.ui.threshold_settings_dialog.ThresholdSettingsDialog')
     def test_open_threshold_dialog_button(self, MockThresholdDialog):
         """测试: 点击二值化参数按钮是否会实例化并显示对话框。"""
         # 模拟对话框实例和方法
         mock_dialog_instance = MockThresholdDialog.return_value
         
         # 第一次点击
-        self.control_panel.threshold_btn.click()
-        MockThresholdDialog.assert_called_once_with(self.mock_controller, self.control_panel)
+        self.params_panel.threshold_btn.click()
+        MockThresholdDialog.assert_called_once_with(self.mock_controller, self.params_panel)
         mock_dialog_instance.show.assert_called_once()
         mock_dialog_instance.activateWindow.assert_called_once()
 
-        # 第二次点击，不应再次创建实例
-        self.control_panel.threshold_btn.click()
+        # 第二次直接调用槽函数（按钮到槽的连接已由第一次点击验证），不应再次创建实例
+        self.params_panel._open_threshold_dialog()
         MockThresholdDialog.assert_called_once() # 确认构造函数仍只被调用一次
         self.assertEqual(mock_dialog_instance.show.call_count, 2)
         self.assertEqual(mock_dialog_instance.activateWindow.call_count, 2)
 
-    @patch('src.app.ui.control_panel.MorphologySettingsDialog')
+    @patch('src.app.ui.morphology_settings_dialog.MorphologySettingsDialog')
     def test_open_morphology_dialog_button(self, MockMorphologyDialog):
         """测试: 点击形态学参数按钮是否会实例化并显示对话框。"""
         mock_dialog_instance = MockMorphologyDialog.return_value
-        self.control_panel.morphology_btn.click()
-        MockMorphologyDialog.assert_called_once_with(self.mock_controller, self.control_panel)
+        self.params_panel.morphology_btn.click()
+        MockMorphologyDialog.assert_called_once_with(self.mock_controller, self.params_panel)
         mock_dialog_instance.show.assert_called_once()
 
-    @patch('src.app.ui.control_panel.FilteringSettingsDialog')
+    @patch('src.app.ui.filtering_settings_dialog.FilteringSettingsDialog')
     def test_open_filtering_dialog_button(self, MockFilteringDialog):
         """测试: 点击过滤参数按钮是否会实例化并显示对话框。"""
         mock_dialog_instance = MockFilteringDialog.return_value
-        self.control_panel.filtering_btn.click()
-        MockFilteringDialog.assert_called_once_with(self.mock_controller, self.control_panel)
+        self.params_panel.filtering_btn.click()
+        MockFilteringDialog.assert_called_once_with(self.mock_controller, self.params_panel)
         mock_dialog_instance.show.assert_called_once()
 
 if __name__ == '__main__':
-    unittest.main() 
\ No newline at end of file
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""测试导出工具模块。
+
+该模块验证 export_to_csv 在各行键不一致时仍能完整写出所有列，
+以及 Word 表格的按列格式化对混合类型列的处理。
+"""
+
+import csv
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.app.utils.exporter import _format_column, export_to_csv
+
+
+class TestExportToCsv(unittest.TestCase):
+    """测试export_to_csv的表头和行写出。"""
+
+    def setUp(self):
+        """为每个测试用例准备一个临时的CSV路径。"""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.csv_path = os.path.join(tmp_dir.name, "details.csv")
+
+    def _read_rows(self):
+        with open(self.csv_path, newline='', encoding='utf-8-sig') as f:
+            return list(csv.DictReader(f))
+
+    def test_headers_are_union_of_row_keys(self):
+        """测试: 后续行中出现的新键也会写入表头，缺少的列留空。"""
+        export_to_csv([
+            {'id': 1, 'length_mm': 1.5},
+            {'id': 2, 'angle': 30},
+        ], self.csv_path)
+
+        rows = self._read_rows()
+        self.assertEqual(list(rows[0].keys()), ['id', 'length_mm', 'angle'])
+        self.assertEqual(rows[0], {'id': '1', 'length_mm': '1.5', 'angle': ''})
+        self.assertEqual(rows[1], {'id': '2', 'length_mm': '', 'angle': '30'})
+
+    def test_empty_data_raises(self):
+        """测试: 空数据不会生成文件，而是抛出ValueError。"""
+        with self.assertRaises(ValueError):
+            export_to_csv([], self.csv_path)
+        self.assertFalse(os.path.exists(self.csv_path))
+
+
+class TestFormatColumn(unittest.TestCase):
+    """测试_format_column对不同类型列的格式化。"""
+
+    def test_float_column_is_formatted_with_four_decimals(self):
+        """测试: 全部为浮点数的列统一保留四位小数。"""
+        column = _format_column([1.5, np.float64(2.25), np.float32(0.5)])
+        self.assertEqual(list(column), ['1.5000', '2.2500', '0.5000'])
+
+    def test_mixed_float_and_int_column_formats_each_value_by_type(self):
+        """测试: 首行为浮点数时，后续的整数和布尔值按各自类型格式化。"""
+        column = _format_column([1.5, 2, True])
+        self.assertEqual(list(column), ['1.5000', '2', 'True'])
+
+    def test_column_with_none_keeps_none(self):
+        """测试: 含None的列不会把None格式化为nan。"""
+        column = _format_column([1.5, None])
+        self.assertEqual(list(column), ['1.5000', 'None'])
+
+
+if __name__ == '__main__':
+    unittest.main()
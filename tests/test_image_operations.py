@@ -0,0 +1,296 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试通用图像处理操作模块。
+
+该模块包含对 image_operations 中灰度化、去噪、阈值分割和形态学后处理函数的单元测试，
+以及对 FractureAnalyzer 中裂缝筛选与合并步骤的测试。
+"""
+
+import unittest
+import os
+import re
+import cv2
+import numpy as np
+from pathlib import Path
+
+# 导入被测试的模块
+from src.app.core import image_operations as ops
+from src.app.core.analyzers.fracture_analyzer import FractureAnalyzer
+
+# 仅在设置了 SAVE_TEST_OUTPUTS 环境变量时才把处理结果写入 tests/output
+SAVE_TEST_OUTPUTS = bool(os.environ.get("SAVE_TEST_OUTPUTS"))
+# 逐个处理测试目录中全部图片的慢速测试，仅在设置 RUN_SLOW_TESTS 时运行
+RUN_SLOW_TESTS = bool(os.environ.get("RUN_SLOW_TESTS"))
+# 按扩展名(不区分大小写)筛选测试图片，无需为每个文件名生成小写副本
+TEST_IMAGE_RE = re.compile(r'\.(?:png|jpe?g|bmp)\Z', re.IGNORECASE)
+# 测试图片与输出目录的路径在导入时确定一次
+TEST_IMAGES_DIR = Path(__file__).parent
+TEST_IMAGE_PATH = str(TEST_IMAGES_DIR / "2.jpg")
+OUTPUT_DIR = TEST_IMAGES_DIR / "output"
+
+
+def _morph_params(kernel_size, iterations=1, **extra):
+    """构造 apply_morphological_postprocessing 所需的单个运算参数。"""
+    return {'enabled': True, 'kernel_shape': 'rect',
+            'kernel_size': (kernel_size, kernel_size), 'iterations': iterations, **extra}
+
+
+class TestImageOperations(unittest.TestCase):
+    """测试image_operations中的函数及FractureAnalyzer的裂缝处理步骤。"""
+
+    @classmethod
+    def setUpClass(cls):
+        """一次性解码测试目录中的所有图片，供整个测试类共用。
+
+        测试图像都很小，OpenCV 的多线程调度开销大于计算本身，
+        因此在本测试类中以单线程运行，结束后恢复原设置。
+        """
+        # FractureAnalyzer 不保存逐次调用的状态，整个测试类共用一个实例即可
+        cls.analyzer = FractureAnalyzer()
+
+        # 按路径缓存解码后的图片；无法解码的图片不缓存，由使用它的测试自行报告
+        cls._img_cache = {}
+        # scandir 的 DirEntry 自带文件类型信息，无需为每个条目额外 stat
+        with os.scandir(TEST_IMAGES_DIR) as entries:
+            cls._test_image_names = [
+                e.name for e in entries
+                if e.is_file() and TEST_IMAGE_RE.search(e.name)
+            ]
+        for image_name in cls._test_image_names:
+            cls._load_into_cache(str(TEST_IMAGES_DIR / image_name))
+
+        if SAVE_TEST_OUTPUTS:
+            os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+        cls._saved_cv2_threads = cv2.getNumThreads()
+        cls._saved_omp_threads = os.environ.get("OMP_NUM_THREADS")
+        os.environ["OMP_NUM_THREADS"] = "1"
+        cv2.setNumThreads(1)
+
+    @classmethod
+    def tearDownClass(cls):
+        """恢复 OpenCV 和 OpenMP 的线程设置。"""
+        cv2.setNumThreads(cls._saved_cv2_threads)
+        if cls._saved_omp_threads is None:
+            os.environ.pop("OMP_NUM_THREADS", None)
+        else:
+            os.environ["OMP_NUM_THREADS"] = cls._saved_omp_threads
+
+    def setUp(self):
+        """测试前的设置。"""
+        # 创建一个简单的灰度测试图像 (numpy array)
+        # 使用这两张图的测试只检查可调用性和输出形状，小尺寸即可
+        self.gray_test_image = np.zeros((32, 32), dtype=np.uint8)
+        self.gray_test_image[8:16, 8:16] = 150  # 一个灰度方块
+
+        # 创建一个简单的二值测试图像（前景为白色，与阈值分割的输出一致）
+        self.binary_test_image = np.zeros((32, 32), dtype=np.uint8)
+        self.binary_test_image[2:4, 2:4] = 255 # 小的白色噪点区域
+        self.binary_test_image[10:20, 10:20] = 255 # 较大的白色对象区域
+
+    def _save_output(self, name, image):
+        """在启用 SAVE_TEST_OUTPUTS 时保存处理结果，便于人工检查。"""
+        if SAVE_TEST_OUTPUTS:
+            # 调试用的临时输出，PNG 以不压缩方式写入，省去 deflate 开销
+            cv2.imwrite(str(OUTPUT_DIR / name), image, [cv2.IMWRITE_PNG_COMPRESSION, 0])
+
+    @classmethod
+    def _load_into_cache(cls, path):
+        """解码图片并以只读数组存入缓存，防止测试意外修改共享的图像。
+
+        无法解码时返回 None 且不缓存，下次访问会重新尝试。
+        """
+        image = cv2.imread(path)
+        if image is not None:
+            image.setflags(write=False)
+            cls._img_cache[path] = image
+        return image
+
+    def _get_image(self, path):
+        """返回指定路径的图片，未缓存时解码并缓存。
+
+        返回的是只读的缓存图像而非副本：灰度化、滤波等处理都会生成新数组，
+        不会修改输入图像。需要原地修改的测试应自行 copy()。
+        无法解码的路径返回 None。
+        """
+        cached = self._img_cache.get(path)
+        if cached is None:
+            cached = self._load_into_cache(path)
+        return cached
+
+    def test_analyze_fractures_with_length_filter(self):
+        """测试_analyze_and_filter_fractures是否能根据长度正确过滤裂缝。"""
+        # 1. 准备一个测试图像：阈值分割后的二值图中裂缝为白色，背景为黑色
+        binary_image = np.zeros((200, 200), dtype=np.uint8)
+
+        # 在图像上绘制两条白色的"裂缝"，一条长，一条短
+        # 短裂缝 (长度约10像素)
+        cv2.line(binary_image, (20, 20), (20, 30), 255, 2)
+        # 长裂缝 (长度约50像素)
+        cv2.line(binary_image, (50, 50), (50, 100), 255, 2)
+
+        # 2. 设置长度阈值，15像素应该可以过滤掉短裂缝
+        min_len_pixels = 15.0
+        fractures = self.analyzer._analyze_and_filter_fractures(binary_image, {
+            'min_aspect_ratio': 1.0, # 设置一个低的长宽比以确保裂缝被检测
+            'min_length_pixels': min_len_pixels,
+        })
+
+        # 3. 验证结果
+        # 应该只检测到一条裂缝
+        self.assertEqual(len(fractures), 1, "应该只检测到一条长度大于阈值的裂缝")
+
+        # 验证被检测到的裂缝长度确实大于阈值
+        self.assertGreater(fractures[0]['length_pixels'], min_len_pixels, "检测到的裂缝长度应大于最小长度阈值")
+
+    def test_convert_to_grayscale(self):
+        """测试将彩色图像转换为灰度图的功能。"""
+        # 加载测试图片
+        image = self._get_image(TEST_IMAGE_PATH)
+
+        # 转换为灰度图
+        gray_image = ops.convert_to_grayscale(image)
+
+        # 验证结果是灰度图
+        self.assertEqual(len(gray_image.shape), 2, "灰度图应该只有两个维度")
+
+        # 保存灰度图
+        self._save_output("grayscale_output.png", gray_image)
+
+    def test_apply_gaussian_blur(self):
+        """测试高斯滤波去噪功能。"""
+        # 加载测试图片
+        image = self._get_image(TEST_IMAGE_PATH)
+
+        # 转换为灰度图
+        gray_image = ops.convert_to_grayscale(image)
+
+        # 应用高斯滤波
+        blurred_image = ops.apply_gaussian_blur(gray_image)
+
+        # 验证结果图像形状与灰度图相同
+        self.assertEqual(blurred_image.shape, gray_image.shape,
+                         "滤波后的图像形状应与输入图像相同")
+
+        # 保存滤波后的图像
+        self._save_output("gaussian_blur_output.png", blurred_image)
+
+    def test_process_image(self):
+        """测试分析器使用的预处理流程（灰度化和去噪）。"""
+        # 加载测试图片
+        image = self._get_image(TEST_IMAGE_PATH)
+
+        # 处理图像
+        processed_image = ops.apply_gaussian_blur(ops.convert_to_grayscale(image))
+
+        # 验证结果
+        self.assertEqual(len(processed_image.shape), 2,
+                         "处理后的图像应该是灰度图，只有两个维度")
+
+        # 保存处理后的图像；不保存时仍在内存中编码一次，确认结果可被编码为PNG
+        if SAVE_TEST_OUTPUTS:
+            self._save_output("processed_image_output.png", processed_image)
+        else:
+            ok, _ = cv2.imencode(".png", processed_image, [cv2.IMWRITE_PNG_COMPRESSION, 0])
+            self.assertTrue(ok, "处理后的图像应能编码为PNG")
+
+    # 局部阈值方法的参数用例：(方法名, 函数, 参数)
+    THRESHOLD_CASES = (
+        ('niblack', ops.apply_niblack_threshold, {'window_size': 11, 'k': 0.2}),
+        ('sauvola', ops.apply_sauvola_threshold, {'window_size': 11, 'k': 0.2, 'r': 128}),
+    )
+
+    # 形态学后处理的参数用例：(用例名, 开运算参数, 闭运算参数)
+    MORPHOLOGY_CASES = (
+        ('area_based_opening', _morph_params(3, min_area=50), None),
+        ('standard_closing', None, _morph_params(7, iterations=3)),
+    )
+
+    def test_local_threshold_methods(self):
+        """测试局部阈值方法(Niblack, Sauvola)输出与输入同尺寸的二值图。"""
+        processed_image = ops.apply_gaussian_blur(self.gray_test_image)
+
+        for method, threshold_func, params in self.THRESHOLD_CASES:
+            with self.subTest(method=method):
+                binary = threshold_func(processed_image, **params)
+                self.assertEqual(binary.shape, self.gray_test_image.shape)
+
+    def test_morphological_postprocessing_cases(self):
+        """测试基于面积的开运算与标准闭运算的输出。"""
+        for name, opening_params, closing_params in self.MORPHOLOGY_CASES:
+            with self.subTest(case=name):
+                result = ops.apply_morphological_postprocessing(
+                    self.binary_test_image, opening_params=opening_params, closing_params=closing_params)
+                self.assertEqual(result.shape, self.binary_test_image.shape)
+
+    def test_merge_fractures_passthrough(self):
+        """测试_merge_fractures在未启用或裂缝不足两条时原样返回输入。"""
+        self.assertEqual(self.analyzer._merge_fractures([], {'enabled': True}, dpi=300), [])
+
+        fractures = [{'length_pixels': 10}, {'length_pixels': 20}]
+        self.assertIs(self.analyzer._merge_fractures(fractures, {'enabled': False}, dpi=300), fractures)
+
+    @unittest.skipUnless(RUN_SLOW_TESTS, "慢速I/O测试，设置 RUN_SLOW_TESTS=1 后运行")
+    def test_all_test_images(self):
+        """测试目录中的所有测试图片。
+
+        逐张串行处理，但在本测试期间把 OpenCV 的线程数调到CPU核数，
+        由其内部的 parallel_for_ 在行级别并行灰度化和滤波。
+        """
+        cv2.setNumThreads(cv2.getNumberOfCPUs())
+        try:
+            for image_name in self._test_image_names:
+                with self.subTest(image=image_name):
+                    # 加载图片
+                    image = self._get_image(str(TEST_IMAGES_DIR / image_name))
+                    self.assertIsNotNone(image, f"无法加载图片 {image_name}")
+
+                    # 处理图像
+                    processed_image = ops.apply_gaussian_blur(ops.convert_to_grayscale(image))
+
+                    # 保存处理后的图像
+                    # 逐图输出只是临时调试产物，统一写成无压缩的 BMP
+                    self._save_output(f"processed_{Path(image_name).stem}.bmp", processed_image)
+        finally:
+            # 其余测试图像很小，恢复 setUpClass 中设置的单线程
+            cv2.setNumThreads(1)
+
+    def test_morphological_operations_logic(self):
+        """测试形态学开运算和闭运算的逻辑是否正确。
+
+        开运算应该移除小的白色物体（噪点）。
+        闭运算应该填充白色物体内部的小孔洞。
+        """
+        # 1. 准备一个专门的测试图像：与阈值分割的输出一致，背景为黑色 (0)，前景裂缝为白色 (255)
+        test_image = np.zeros((30, 30), dtype=np.uint8)
+        # 添加一个 2x2 的白色噪点
+        test_image[3:5, 3:5] = 255
+        # 添加一个 10x10 的主裂缝
+        test_image[10:20, 10:20] = 255
+        # 在主裂缝中添加一个 2x2 的黑色孔洞
+        test_image[14:16, 14:16] = 0
+
+        # 2. 测试开运算（去噪）
+        # 开运算的核应该足够大以移除噪点，但又不能大到移除主裂缝
+        opened_image = ops.apply_morphological_postprocessing(test_image, opening_params=_morph_params(3))
+
+        # 验证：噪点应该被移除（变为黑色）
+        self.assertEqual(opened_image[3, 3], 0, "开运算后，噪点区域应变为黑色")
+        # 验证：主裂缝应该被保留（保持白色）
+        self.assertEqual(opened_image[11, 11], 255, "开运算后，主裂缝区域应保持白色")
+        # 验证：孔洞应该不受影响
+        self.assertEqual(opened_image[15, 15], 0, "开运算不应影响主裂缝内部的孔洞")
+
+        # 3. 测试闭运算（填充孔洞）
+        closed_image = ops.apply_morphological_postprocessing(test_image, closing_params=_morph_params(3))
+
+        # 验证：孔洞应该被填充（变为白色）
+        self.assertEqual(closed_image[15, 15], 255, "闭运算后，孔洞区域应被填充为白色")
+        # 验证：噪点应该不受影响
+        self.assertEqual(closed_image[3, 3], 255, "闭运算不应影响外部噪点")
+
+
+if __name__ == "__main__":
+    unittest.main()
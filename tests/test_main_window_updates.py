@@ -2,112 +2,109 @@
 
 该模块包含针对 MainWindow 中与UI更新相关的槽函数的单元测试。
 它验证当控制器发出信号时，主窗口是否正确地调用了
-其子组件（如ResultPanel, PreviewWindow）的更新方法。
+其子组件（如ResultPanel、结果对话框）的更新方法。
 """
 import unittest
-from unittest.mock import Mock, patch, MagicMock
-
-# 模拟PyQt5导入，因为在测试环境中我们不运行GUI
-# 这必须在导入被测模块之前完成
-import sys
-mock_pyqt = MagicMock()
-sys.modules['PyQt5'] = mock_pyqt
-sys.modules['PyQt5.QtWidgets'] = mock_pyqt.QtWidgets
-sys.modules['PyQt5.QtGui'] = mock_pyqt.QtGui
-sys.modules['PyQt5.QtCore'] = mock_pyqt.QtCore
-
-
-# 模拟本地模块的导入
-# 我们只需要测试 MainWindow 的逻辑，不需要真实的UI或Core组件
-sys.modules['src.app.ui.control_panel'] = MagicMock()
-sys.modules['src.app.ui.result_panel'] = MagicMock()
-sys.modules['src.app.ui.preview_window'] = MagicMock()
-sys.modules['src.app.ui.analysis_preview_window'] = MagicMock()
-sys.modules['src.app.ui.measurement_dialog'] = MagicMock()
-sys.modules['src.app.ui.style_manager'] = MagicMock()
-sys.modules['src.app.core.controller'] = MagicMock()
-# sys.modules['src.app.ui.main_window'] = MagicMock() # <-- 这一行是错误的，我们需要真实的MainWindow
-
-# 现在可以安全地导入被测模块了
+from unittest.mock import Mock, patch, create_autospec
+
+import pytest
+
 from src.app.ui.main_window import MainWindow
-from src.app.core.analysis_stages import AnalysisStage
+from src.app.ui.result_panel import ResultPanel
+from src.app.utils.constants import PreviewState
+
+# 共用 tests/conftest.py 中会话级的 QApplication 实例
+pytestmark = pytest.mark.usefixtures("qapp")
 
 
 class TestMainWindowUpdates(unittest.TestCase):
     """测试MainWindow的信号响应和UI更新调用。"""
 
-    @patch('src.app.core.controller.Controller')
-    def setUp(self, MockController):
-        """为每个测试用例设置环境。"""
-        # 阻止 MainWindow 的 UI 初始化和信号连接
-        with patch.object(MainWindow, '_init_ui', return_value=None), \
-             patch.object(MainWindow, '_connect_signals', return_value=None):
+    @classmethod
+    def setUpClass(cls):
+        """只创建一次 MainWindow 和模拟组件，各测试用例之间通过 reset_mock 复位。
+
+        我们只需要测试 MainWindow 的逻辑，不需要真实的子控件或控制器：
+        控制器和 UI 初始化在类级别被 patch，按启动的相反顺序由 addClassCleanup 停止。
+        """
+        # 阻止 MainWindow 创建真实的控制器以及 UI 初始化和信号连接
+        cls.MockController = cls._start_class_patch(patch('src.app.ui.main_window.Controller'))
+        cls._start_class_patch(patch.object(MainWindow, '_init_ui', return_value=None))
+
+        # 实例化 MainWindow
+        # 它会调用被 patch 的 _init_ui，所以不会创建真实UI
+        cls.main_window = MainWindow()
+        cls.addClassCleanup(cls.main_window.deleteLater)
+
+        # 现在手动设置模拟的控制器和UI组件
+        cls.mock_controller = cls.main_window.controller
+        # autospec 只在类级别构建一次，且对不存在的方法或错误的参数签名会直接报错
+        cls.main_window.result_panel = create_autospec(ResultPanel, instance=True)
+        cls.main_window.main_preview_window = Mock()
+        cls.main_window.statusBar = Mock() # statusBar 也是在 _init_ui 中创建的
+        cls.result_dialog = Mock()
+
+        cls._mocks = (
+            cls.mock_controller,
+            cls.main_window.result_panel,
+            cls.main_window.main_preview_window,
+            cls.main_window.statusBar,
+            cls.result_dialog,
+        )
+
+    @classmethod
+    def _start_class_patch(cls, patcher):
+        """启动一个在整个测试类期间保持生效的 patch，并登记类级清理。"""
+        started = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+        return started
 
-            # 实例化 MainWindow
-            # 它会调用被 patch 的 _init_ui，所以不会创建真实UI
-            self.main_window = MainWindow()
+    def setUp(self):
+        """为每个测试用例复位模拟对象的调用记录和预设返回值。"""
+        self._reset_mocks()
+        self.main_window.current_result_dialog = self.result_dialog
 
-            # 现在手动设置模拟的控制器和UI组件
-            self.mock_controller = MockController()
-            self.main_window.controller = self.mock_controller
-            self.main_window.result_panel = Mock()
-            self.main_window.preview_window = Mock()
-            self.main_window.analysis_preview_window = Mock()
-            self.main_window.statusBar = Mock() # statusBar 也是在 _init_ui 中创建的
+    def _reset_mocks(self):
+        """复位所有共享模拟对象；同一测试内的多个 subTest 之间也会调用。"""
+        for mock in self._mocks:
+            mock.reset_mock(return_value=True, side_effect=True)
 
 
     def test_on_analysis_complete_updates_result_panel(self):
-        """测试 _on_analysis_complete 是否调用 result_panel 的更新方法。"""
+        """测试 _on_analysis_complete 是否更新结果面板、结果对话框和状态栏。"""
         # 1. 准备
         test_results = {'count': 10, 'total_area_mm2': 50.5}
-        
+
         # 2. 调用
         # 直接调用槽函数，模拟从控制器接收到信号
         self.main_window._on_analysis_complete(test_results)
-        
+
         # 3. 验证
         # 检查 result_panel.update_analysis_results 是否被以正确的参数调用了一次
         self.main_window.result_panel.update_analysis_results.assert_called_once_with(test_results)
+        # 完整结果以 READY 状态转发给结果对话框
+        self.result_dialog.update_content.assert_called_once_with({
+            'state': PreviewState.READY,
+            'payload': test_results
+        })
+        self.main_window.statusBar().showMessage.assert_called_with("分析完成")
 
-    def test_on_preview_stage_updated_for_detection_updates_main_preview(self):
-        """测试 _on_preview_stage_updated 在DETECTION阶段是否更新主预览窗口。"""
-        # 1. 准备
-        stage = AnalysisStage.DETECTION
-        mock_image = "mock_detection_image"
-        result_data = {"image": mock_image}
-        
-        # 2. 调用
-        self.main_window._on_preview_stage_updated(stage, result_data)
-        
-        # 3. 验证
-        # 验证主预览窗口的 update_image 被调用
-        self.main_window.preview_window.update_image.assert_called_once_with(mock_image)
-        # 验证分析预览窗口也被调用
-        self.main_window.analysis_preview_window.update_stage_preview.assert_called_once()
+    def test_on_preview_updated(self):
+        """测试 _on_preview_updated 在各预览状态下将载荷原样转发给结果对话框。"""
+        for state in (PreviewState.LOADING, PreviewState.READY, PreviewState.ERROR):
+            with self.subTest(state=state):
+                self._reset_mocks()
+                payload = {'state': state, 'payload': {}}
 
+                self.main_window._on_preview_updated(payload)
 
-    def test_on_preview_stage_updated_for_measurement_uses_detection_image(self):
-        """测试 _on_preview_stage_updated 在MEASUREMENT阶段是否使用DETECTION图像。"""
-        # 1. 准备
-        stage = AnalysisStage.MEASUREMENT
-        summary_text = "summary"
-        result_data = {"summary": summary_text}
-        
-        mock_detection_image = "final_detection_image"
-        # 设置模拟的控制器状态，使其在被查询时能返回DETECTION图像
-        self.mock_controller.analysis_results.get.return_value = {"image": mock_detection_image}
+                self.result_dialog.update_content.assert_called_once_with(payload)
 
-        # 2. 调用
-        self.main_window._on_preview_stage_updated(stage, result_data)
-
-        # 3. 验证
-        # 验证 analysis_preview_window 是用DETECTION图像和摘要文本调用的
-        self.main_window.analysis_preview_window.update_stage_preview.assert_called_once_with(
-            stage, mock_detection_image, summary_text
-        )
-        # 验证 get 是用 AnalysisStage.DETECTION 调用的
-        self.mock_controller.analysis_results.get.assert_called_once_with(AnalysisStage.DETECTION, {})
+        with self.subTest(dialog=None):
+            # 尚未创建结果对话框时应直接忽略预览更新
+            self.main_window.current_result_dialog = None
+            self.main_window._on_preview_updated({'state': PreviewState.READY})
 
 
 if __name__ == '__main__':
-    unittest.main() 
\ No newline at end of file
+    unittest.main()
@@ -5,25 +5,46 @@
 """
 
 import unittest
+import copy
+import functools
 import numpy as np
 from unittest.mock import MagicMock, patch
 
-from PyQt5.QtWidgets import QApplication, QWidget
-
-# 确保在GUI组件实例化之前有一个QApplication实例
-app = QApplication.instance()
-if app is None:
-    app = QApplication([])
+import pytest
 
 from src.app.core.controller import Controller
 from src.app.ui.control_panel import ControlPanel
+from src.app.ui.parameter_panels.fracture_params_panel import FractureParamsPanel
+
+# 共用 tests/conftest.py 中会话级的 QApplication 实例
+pytestmark = pytest.mark.usefixtures("qapp")
+
+
+@functools.lru_cache(maxsize=8)
+def _zero_image(height, width):
+    """返回指定尺寸的黑色BGR虚拟图像，同一尺寸只分配一次。
+
+    缓存的数组在各测试间共享，因此设为只读：任何原地修改都会直接报错，
+    而不是悄悄污染后续测试的输入。
+    """
+    image = np.zeros((height, width, 3), dtype=np.uint8)
+    image.setflags(write=False)
+    return image
 
 class TestRefactoringIntegrity(unittest.TestCase):
     """测试用例，验证重构后的架构完整性。"""
 
+    @classmethod
+    def setUpClass(cls):
+        """只创建一次Controller（注册分析器、加载默认参数），所有测试共用。"""
+        cls.controller = Controller()
+        cls._analyzers = copy.copy(cls.controller.analyzers)
+
     def setUp(self):
-        """在每个测试用例前执行。"""
-        self.controller = Controller()
+        """在每个测试用例前执行：恢复分析器注册表和图像状态，避免测试间相互影响。"""
+        self.controller.analyzers = copy.copy(self._analyzers)
+        self.controller.current_image = None
+        self.controller.current_dpi = None
 
     def test_analyzer_registration(self):
         """测试1: 验证Controller是否能成功注册FractureAnalyzer。"""
@@ -32,38 +53,33 @@ class TestRefactoringIntegrity(unittest.TestCase):
         self.assertEqual(self.controller.active_analyzer.get_id(), "fracture")
         print("[Test OK] FractureAnalyzer successfully registered and activated.")
 
-    @patch('src.app.core.analyzers.fracture_analyzer.FractureAnalyzer.create_parameter_widget')
-    def test_ui_dynamic_setup(self, mock_create_widget):
+    def test_ui_dynamic_setup(self):
         """测试2: 验证ControlPanel是否能根据注册的分析器动态构建UI。"""
-        # 创建一个模拟的QWidget，因为我们不想真的创建UI
-        mock_widget = QWidget()
-        mock_create_widget.return_value = mock_widget
-
-        # 模拟信号/槽连接
         control_panel = ControlPanel(self.controller)
+        self.addCleanup(control_panel.deleteLater)
         # 手动调用槽函数，因为我们没有运行Qt事件循环
-        control_panel._on_analyzers_registered(
-            [(analyzer.get_id(), analyzer.get_name()) for analyzer in self.controller.analyzers.values()]
-        )
-        
-        self.assertEqual(control_panel.mode_selector_combo.count(), 1)
+        control_panel._on_analyzers_registered(self.controller.get_registered_analyzers())
+
+        self.assertEqual(control_panel.mode_selector_combo.count(), len(self.controller.analyzers))
         self.assertEqual(control_panel.mode_selector_combo.itemText(0), "裂缝分析")
         self.assertEqual(control_panel.mode_selector_combo.itemData(0), "fracture")
+        # 只为当前选中的分析器创建参数面板
         self.assertEqual(control_panel.params_stack.count(), 1)
-        self.assertEqual(control_panel.params_stack.currentWidget(), mock_widget)
+        self.assertIsInstance(control_panel.params_stack.currentWidget(), FractureParamsPanel)
         print("[Test OK] ControlPanel UI dynamically set up for FractureAnalyzer.")
 
     def test_analysis_execution(self):
         """测试3: 验证核心分析流程是否能被完整调用并返回预期格式的结果。"""
-        # 创建一个100x100的黑色虚拟图像
-        test_image = np.zeros((100, 100, 3), dtype=np.uint8)
-        self.controller.current_image = test_image
+        # 使用一个100x100的黑色虚拟图像
+        self.controller.current_image = _zero_image(100, 100)
         self.controller.current_dpi = (300, 300) # 模拟DPI
 
         # 直接调用完整的分析方法
         # 使用MagicMock来捕获analysis_complete信号发出的数据
         mock_slot = MagicMock()
         self.controller.analysis_complete.connect(mock_slot)
+        # 共享的Controller在测试结束后断开该槽，以免影响其它测试
+        self.addCleanup(self.controller.analysis_complete.disconnect, mock_slot)
         
         self.controller.run_full_analysis()
 
@@ -74,11 +90,36 @@ class TestRefactoringIntegrity(unittest.TestCase):
 
         # 验证返回结果的结构是否正确
         self.assertIsInstance(result, dict)
-        self.assertIn('count', result)
-        self.assertIn('total_area_mm2', result)
-        self.assertIn('total_length_mm', result)
-        self.assertIn('details', result)
+        self.assertIn('visualization', result)
+        measurements = result['measurements']
+        self.assertIn('count', measurements)
+        self.assertIn('total_area_mm2', measurements)
+        self.assertIn('total_length_mm', measurements)
+        self.assertIn('details', measurements)
         print("[Test OK] Full analysis execution call successful with correct result structure.")
 
+    def test_staged_preview_scale_is_per_request(self):
+        """测试4: 降采样预览的比例只作用于单次请求，且阈值窗口随之缩小。"""
+        self.controller.current_image = _zero_image(100, 100)
+        # 共享的Controller在测试结束后恢复原有参数，以免影响其它测试
+        self.addCleanup(setattr, self.controller, 'analysis_params', self.controller.analysis_params)
+        self.controller.analysis_params = {'threshold': {'method': 'sauvola', 'window_size': 51}}
+
+        with patch.object(self.controller.active_analyzer, 'run_staged_analysis',
+                          return_value={'previews': {}}) as mock_staged:
+            self.controller.request_realtime_preview('binary', scale=0.5)
+            image, params, _ = mock_staged.call_args[0]
+            self.assertEqual(image.shape[:2], (50, 50))
+            self.assertEqual(params['threshold']['window_size'], 27)
+            # 原参数不被修改
+            self.assertEqual(self.controller.analysis_params['threshold']['window_size'], 51)
+
+            # 之后的普通预览恢复原始分辨率
+            self.controller.request_realtime_preview('binary')
+            image, params, _ = mock_staged.call_args[0]
+            self.assertEqual(image.shape[:2], (100, 100))
+            self.assertEqual(params['threshold']['window_size'], 51)
+
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""测试结果面板的详细数据模型。
+
+该模块验证 DetailsTableModel 是否能正确地将详细数据字典列表
+暴露为表格的行、列、表头和格式化后的单元格文本。
+"""
+
+import unittest
+
+from PyQt5.QtCore import Qt
+
+from src.app.ui.result_panel import DetailsTableModel
+
+
+class TestDetailsTableModel(unittest.TestCase):
+    """测试DetailsTableModel的数据访问接口。"""
+
+    def setUp(self):
+        """为每个测试用例准备一个带有两行数据的模型。"""
+        self.model = DetailsTableModel()
+        self.rows = [
+            {'id': 1, 'total_length_mm': 1.23456789},
+            {'id': 2, 'total_length_mm': 2.0},
+        ]
+        self.model.set_rows(self.rows)
+
+    def test_row_and_column_count(self):
+        """测试: 行数和列数与输入数据一致。"""
+        self.assertEqual(self.model.rowCount(), 2)
+        self.assertEqual(self.model.columnCount(), 2)
+
+    def test_header_uses_key_map(self):
+        """测试: 水平表头使用KEY_MAP翻译，未知键保持原样。"""
+        self.assertEqual(self.model.headerData(0, Qt.Horizontal), 'id')
+        self.assertEqual(self.model.headerData(1, Qt.Horizontal), '总长度 (mm)')
+
+    def test_float_values_are_formatted(self):
+        """测试: 浮点数保留四位小数，其它值转换为字符串。"""
+        self.assertEqual(self.model.data(self.model.index(0, 0)), '1')
+        self.assertEqual(self.model.data(self.model.index(0, 1)), '1.2346')
+        self.assertEqual(self.model.data(self.model.index(1, 1)), '2.0000')
+
+    def test_mixed_column_types_are_formatted_per_value(self):
+        """测试: 同一列中后续行的 None 或字符串值不会按第一行的浮点格式化。"""
+        self.model.set_rows([
+            {'id': 1, 'length_mm': 1.5},
+            {'id': 2, 'length_mm': None},
+            {'id': 3, 'length_mm': 'n/a'},
+            {'id': 4.0},
+        ])
+        self.assertEqual(self.model.data(self.model.index(0, 1)), '1.5000')
+        self.assertEqual(self.model.data(self.model.index(1, 1)), 'None')
+        self.assertEqual(self.model.data(self.model.index(2, 1)), 'n/a')
+        self.assertEqual(self.model.data(self.model.index(3, 0)), '4.0000')
+        self.assertEqual(self.model.data(self.model.index(3, 1)), 'None')
+
+    def test_set_rows_empty_clears_model(self):
+        """测试: 传入空列表会清空模型。"""
+        self.model.set_rows([])
+        self.assertEqual(self.model.rowCount(), 0)
+        self.assertEqual(self.model.columnCount(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
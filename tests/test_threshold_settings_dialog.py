@@ -0,0 +1,84 @@
+"""测试阈值参数设置对话框。
+
+该模块验证 ThresholdSettingsDialog 能够正常构建，
+并在控件回填参数后正确地发出参数变更。
+"""
+
+import unittest
+from unittest.mock import MagicMock
+
+import pytest
+
+from PyQt5.QtWidgets import QSpinBox
+
+from src.app.core.controller import Controller
+from src.app.ui.threshold_settings_dialog import OddSpinBox, ThresholdSettingsDialog
+
+# 共用 tests/conftest.py 中会话级的 QApplication 实例
+pytestmark = pytest.mark.usefixtures("qapp")
+
+
+class TestThresholdSettingsDialog(unittest.TestCase):
+    """测试ThresholdSettingsDialog的构建和参数回填。"""
+
+    def setUp(self):
+        """为每个测试用例创建一个新的对话框。"""
+        self.controller = MagicMock(spec=Controller)
+        self.controller.get_current_parameters.return_value = {}
+        self.dialog = ThresholdSettingsDialog(self.controller)
+        self.addCleanup(self.dialog.deleteLater)
+
+    def test_dialog_builds_with_default_page(self):
+        """测试: 对话框可以直接构建，并创建了默认方法的参数页。"""
+        self.assertEqual(self.dialog.threshold_method_combo.currentIndex(), 0)
+        self.assertIsNotNone(self.dialog._stack_pages[0])
+
+    def test_update_controls_does_not_emit(self):
+        """测试: update_controls 回填参数时不会向外发出参数变更。"""
+        emitted = []
+        self.dialog.parameter_changed.connect(lambda *args: emitted.append(args))
+
+        self.dialog.update_controls({'threshold': {'method': 'sauvola', 'window_size': 31}})
+
+        self.assertEqual(self.dialog.threshold_method_combo.currentIndex(), 4)
+        self.assertEqual(emitted, [])
+
+    def test_shared_widget_names_emit_sender_value(self):
+        """测试: Niblack与Sauvola页面的同名控件发出的是各自控件的值。"""
+        self.dialog.update_controls({'threshold': {'method': 'sauvola', 'window_size': 53}})
+        self.dialog.threshold_method_combo.setCurrentIndex(3)  # Niblack
+        self.dialog._flush_pending()
+
+        emitted = []
+        self.dialog.parameter_changed.connect(lambda *args: emitted.append(args))
+        niblack_spinbox = self.dialog._stack_pages[3].findChild(OddSpinBox, "threshold.window_size_spinbox")
+        niblack_spinbox.setValue(55)
+        self.dialog._flush_pending()
+
+        self.assertEqual(emitted, [('threshold.window_size_spinbox', 55)])
+
+    def test_drag_throttles_and_release_previews_once(self):
+        """测试: 拖动时立即提交并降采样预览，间隔内的变更在松开时提交，且只全分辨率预览一次。"""
+        self.dialog.update_controls({
+            'threshold': {'method': 'global', 'global_value': 100, 'ui_hints': {'realtime': True}}
+        })
+        spinbox = self.dialog._stack_pages[2].findChild(QSpinBox, "threshold.global_value_spinbox")
+        emitted, previews = [], []
+        self.dialog.parameter_changed.connect(lambda *args: emitted.append(args))
+        self.dialog.realtime_preview_requested.connect(lambda *args: previews.append(args))
+
+        self.dialog._on_slider_pressed()
+        spinbox.setValue(101)  # 距上次提交已超过节流间隔：立即提交并降采样预览
+        spinbox.setValue(102)  # 处于节流间隔内：只记录，等待尾随提交
+        self.assertEqual(emitted, [('threshold.global_value_spinbox', 101)])
+        self.assertEqual(previews, [('binary', 0.5)])
+
+        self.dialog._on_slider_released()
+        self.assertEqual(emitted[-1], ('threshold.global_value_spinbox', 102))
+        self.assertEqual(previews, [('binary', 0.5), ('binary', 1.0)])
+        # 预览只经由信号请求，不直接调用控制器
+        self.controller.request_realtime_preview.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,11 +5,6 @@
 
 import unittest
 import numpy as np
-import sys
-import os
-
-# 添加src目录到Python路径
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.app.core.unit_converter import UnitConverter
 
@@ -31,8 +26,8 @@ class TestUnitConverter(unittest.TestCase):
         """测试pixels_to_mm方法处理NumPy数组的情况。"""
         pixels = np.array([100, 200, 300])
         result = UnitConverter.pixels_to_mm(pixels, 96)
-        expected = np.array([26.458333333333332, 52.916666666666664, 79.375])
-        np.testing.assert_almost_equal(result, expected)
+        expected = pixels * (25.4 / 96)
+        np.testing.assert_allclose(result, expected, rtol=1e-12, atol=0)
     
     def test_mm_to_pixels_single_value(self):
         """测试mm_to_pixels方法处理单个数值的情况。"""
@@ -48,8 +43,8 @@ class TestUnitConverter(unittest.TestCase):
         """测试mm_to_pixels方法处理NumPy数组的情况。"""
         mm = np.array([10, 20, 30])
         result = UnitConverter.mm_to_pixels(mm, 96)
-        expected = np.array([37.795275590551178, 75.590551181102362, 113.38582677165354])
-        np.testing.assert_almost_equal(result, expected)
+        expected = mm * (96 / 25.4)
+        np.testing.assert_allclose(result, expected, rtol=1e-12, atol=0)
     
     def test_convert_point(self):
         """测试convert_point方法。"""
@@ -73,6 +68,14 @@ class TestUnitConverter(unittest.TestCase):
         expected = 1244.5216049382714 # (25.4/72)^2 * 10000
         self.assertAlmostEqual(result, expected)
     
+    def test_pixels_mm_round_trip(self):
+        """测试: 多组像素值和DPI下，像素->毫米->像素的往返换算保持原值。"""
+        pixels = np.array([1, 100, 100.5, 1e4])
+        for dpi in (72, 96, 150, 300):
+            with self.subTest(dpi=dpi):
+                mm = UnitConverter.pixels_to_mm(pixels, dpi)
+                np.testing.assert_allclose(UnitConverter.mm_to_pixels(mm, dpi), pixels, rtol=1e-12)
+    
     def test_zero_dpi_error(self):
         """测试DPI为0时抛出ValueError异常。"""
         with self.assertRaises(ValueError):